@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence
+
+from cube import MetricCube
+
+# Metric -> direction that counts as anomalous: -1 for drops, +1 for spikes, 0 for both
+ANOMALY_METRICS = {
+    'On_Time_Delivery_Rate': -1,
+    'Quality_Score': -1,
+    'Defect_Rate_PPM': 1,
+    'Lead_Time_Days': 1
+}
+
+ALERT_COLUMNS = ['Supplier_ID', 'Month', 'Metric', 'Value', 'Expected', 'Z_Score']
+
+
+class EWMADetector:
+    """Exponentially weighted mean and variance per supplier and metric.
+
+    Each new month is scored against the state built from earlier months and
+    then folded into it, so an update costs O(suppliers x metrics) and never
+    revisits history. Missing values leave a supplier's state untouched.
+    """
+
+    def __init__(
+        self,
+        supplier_ids: Sequence,
+        metrics: Optional[Dict[str, int]] = None,
+        alpha: float = 0.2,
+        threshold: float = 3.0,
+        min_periods: int = 6
+    ):
+        self.metrics = dict(ANOMALY_METRICS if metrics is None else metrics)
+        self.directions = np.array(list(self.metrics.values()), dtype=np.float64)
+        self.alpha = alpha
+        self.threshold = threshold
+        self.min_periods = min_periods
+        self.supplier_ids: List = []
+        self.supplier_index: Dict = {}
+        self.mean = np.empty((0, len(self.metrics)))
+        self.var = np.empty((0, len(self.metrics)))
+        self.count = np.empty((0, len(self.metrics)), dtype=np.int64)
+        self.months_seen = 0
+        self.last_month: Optional[str] = None
+        self.alerts: List[pd.DataFrame] = []
+        self.add_suppliers(supplier_ids)
+
+    def add_suppliers(self, supplier_ids: Sequence):
+        """Start empty state for suppliers not seen before"""
+        new = [supplier for supplier in pd.unique(np.asarray(supplier_ids, dtype=object))
+               if supplier not in self.supplier_index]
+        if not new:
+            return
+        for supplier in new:
+            self.supplier_index[supplier] = len(self.supplier_ids)
+            self.supplier_ids.append(supplier)
+        shape = (len(new), len(self.metrics))
+        self.mean = np.vstack([self.mean, np.full(shape, np.nan)])
+        self.var = np.vstack([self.var, np.zeros(shape)])
+        self.count = np.vstack([self.count, np.zeros(shape, dtype=np.int64)])
+
+    def score(self, values: np.ndarray) -> np.ndarray:
+        """Signed z-scores of a supplier x metric matrix against the current state; NaN if not yet scorable"""
+        std = np.sqrt(self.var)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z = (values - self.mean) / std
+        z[(self.count < self.min_periods) | (std == 0)] = np.nan
+        return z
+
+    def update(self, values: np.ndarray) -> np.ndarray:
+        """Score one month (rows aligned with supplier_ids) and fold it into the state"""
+        values = np.asarray(values, dtype=np.float64)
+        z = self.score(values)
+
+        observed = ~np.isnan(values)
+        # Equal weights until 1/n falls below alpha, so the first months give a plain
+        # mean and variance instead of an EWMA anchored on a single observation
+        weight = np.maximum(self.alpha, 1.0 / (self.count + 1))
+        diff = np.where(observed, values - np.nan_to_num(self.mean), 0.0)
+        # West's incremental weighted variance, applied only where a value arrived
+        self.mean = np.where(observed, np.nan_to_num(self.mean) + weight * diff, self.mean)
+        self.var = np.where(observed, (1 - weight) * (self.var + weight * diff * diff), self.var)
+        self.count += observed
+        self.months_seen += 1
+        return z
+
+    def alert_mask(self, z: np.ndarray) -> np.ndarray:
+        """Cells whose z-score crosses the threshold in the metric's anomalous direction"""
+        directed = np.where(self.directions == 0, np.abs(z), z * self.directions)
+        with np.errstate(invalid='ignore'):
+            return directed > self.threshold
+
+    def update_records(self, month: str, records: pd.DataFrame) -> pd.DataFrame:
+        """Stream one month of long-format records and return its alerts"""
+        self.add_suppliers(records['Supplier_ID'])
+        values = np.full((len(self.supplier_ids), len(self.metrics)), np.nan)
+        rows = records['Supplier_ID'].map(self.supplier_index).to_numpy()
+        values[rows] = records[list(self.metrics)].to_numpy(dtype=np.float64)
+        return self.update_month(month, values)
+
+    def update_month(self, month: str, values: np.ndarray) -> pd.DataFrame:
+        """Score and fold in one aligned supplier x metric month, recording its alerts"""
+        expected = self.mean.copy()
+        z = self.update(values)
+        rows, cols = np.nonzero(self.alert_mask(z))
+        metric_names = np.array(list(self.metrics), dtype=object)
+        alerts = pd.DataFrame({
+            'Supplier_ID': np.asarray(self.supplier_ids, dtype=object)[rows],
+            'Month': month,
+            'Metric': metric_names[cols],
+            'Value': values[rows, cols],
+            'Expected': expected[rows, cols],
+            'Z_Score': z[rows, cols]
+        }, columns=ALERT_COLUMNS)
+        self.alerts.append(alerts)
+        self.last_month = month
+        return alerts
+
+    def alert_history(self, last_months: Optional[int] = None) -> pd.DataFrame:
+        """Alerts raised so far, optionally only for the most recent months"""
+        frames = self.alerts if last_months is None else self.alerts[-last_months:]
+        if not frames:
+            return pd.DataFrame(columns=ALERT_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+    @classmethod
+    def from_cube(cls, cube: MetricCube, **kwargs) -> 'EWMADetector':
+        """Detector whose state and alert history come from replaying a cube month by month"""
+        detector = cls(cube.supplier_ids, **kwargs)
+        positions = cube.metrics.get_indexer(list(detector.metrics))
+        for month in cube.months:
+            detector.update_month(month, cube.cross_section(month)[:, positions])
+        return detector
@@ -0,0 +1,267 @@
+"""Read-only JSON API over the analyzer, built on the standard library only.
+
+Run from the repository root: python api.py [--host 127.0.0.1] [--port 8502]
+
+Endpoints (all GET):
+    /api/version                 dataset version the responses are keyed on, and the currency of amounts
+    /api/suppliers               supplier table; offset, limit and fields parameters
+    /api/kpis                    headline KPIs
+    /api/insights                strategic insights
+    /api/categories              per-category aggregates; optional year, plus fields
+
+Every response carries an ETag built from a per-server boot id, the dataset
+version and the request, so a client polling with If-None-Match gets a 304
+without any data being read, and never a 304 from a restarted server.
+"""
+import argparse
+import json
+import os
+import secrets
+import threading
+import zlib
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from analyzer import AdvancedSupplyChainAnalyzer
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Serialized bodies kept per server; the dataset version is part of every key
+RESPONSE_CACHE_SIZE = 256
+
+
+class APIError(Exception):
+    """Raised by endpoint handlers for a client error, returned as JSON with the given status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _json_default(value):
+    """Convert numpy and pandas scalars that the json module does not know"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(payload) -> str:
+    return json.dumps(payload, default=_json_default, separators=(',', ':'))
+
+
+def _int_param(params: Dict[str, List[str]], name: str, default: Optional[int], low: int,
+               high: Optional[int] = None) -> Optional[int]:
+    if name not in params:
+        return default
+    try:
+        value = int(params[name][-1])
+    except ValueError:
+        raise APIError(400, f"'{name}' must be an integer")
+    if value < low or (high is not None and value > high):
+        bounds = f"between {low} and {high}" if high is not None else f"at least {low}"
+        raise APIError(400, f"'{name}' must be {bounds}")
+    return value
+
+
+def _select_fields(frame: pd.DataFrame, params: Dict[str, List[str]]) -> pd.DataFrame:
+    """Keep only the comma-separated ``fields`` columns, in the order requested"""
+    if 'fields' not in params:
+        return frame
+    fields = [field.strip() for field in params['fields'][-1].split(',') if field.strip()]
+    unknown = [field for field in fields if field not in frame.columns]
+    if unknown:
+        raise APIError(400, f"Unknown fields: {', '.join(unknown)}")
+    return frame[fields]
+
+
+def _records(frame: pd.DataFrame) -> str:
+    """JSON array of row objects; pandas handles NaN, numpy types and timestamps"""
+    return frame.to_json(orient='records', date_format='iso')
+
+
+def _page_body(frame: pd.DataFrame, params: Dict[str, List[str]], version: int) -> str:
+    """Paginated envelope around a slice of rows, serialized without building Python row dicts"""
+    offset = _int_param(params, 'offset', 0, 0)
+    limit = _int_param(params, 'limit', DEFAULT_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+    page = _select_fields(frame, params).iloc[offset:offset + limit]
+    next_offset = offset + limit if offset + limit < len(frame) else None
+    header = _dumps({'dataset_version': version, 'total': len(frame), 'offset': offset,
+                     'limit': limit, 'next_offset': next_offset})
+    return f'{header[:-1]},"items":{_records(page)}}}'
+
+
+class SupplyChainAPI:
+    """Endpoint handlers plus a small cache of serialized responses.
+
+    Handlers only read from the analyzer, whose dataset graph is already
+    thread-safe, so one instance serves every request thread.
+    """
+
+    def __init__(self, analyzer: AdvancedSupplyChainAnalyzer):
+        self.analyzer = analyzer
+        # Loading the inputs bumps the dataset version, so do it before the first ETag is handed out
+        analyzer.suppliers_data, analyzer.monthly_data
+        self.routes: Dict[str, Callable[[Dict[str, List[str]], int], str]] = {
+            '/api/version': self.version,
+            '/api/suppliers': self.suppliers,
+            '/api/kpis': self.kpis,
+            '/api/insights': self.insights,
+            '/api/categories': self.categories
+        }
+        # The dataset version restarts with the process; tags from another run must never match
+        self.boot_id = secrets.token_hex(4)
+        self._cache: 'OrderedDict[Tuple, Tuple[str, bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def version(self, params: Dict[str, List[str]], version: int) -> str:
+        return _dumps({'dataset_version': version, 'reporting_currency': self.analyzer.reporting_currency})
+
+    def suppliers(self, params: Dict[str, List[str]], version: int) -> str:
+        return _page_body(self.analyzer.get_supply_chain_data(), params, version)
+
+    def kpis(self, params: Dict[str, List[str]], version: int) -> str:
+        # Only the getters derived from the data; the growth figures are simulated per call
+        # and would change the body without changing the dataset version
+        return _dumps({
+            'dataset_version': version,
+            'active_suppliers': self.analyzer.get_active_suppliers_count(),
+            'total_volume': self.analyzer.get_total_volume(),
+            'performance_score': self.analyzer.get_performance_score(),
+            'high_risk_count': self.analyzer.get_high_risk_count()
+        })
+
+    def insights(self, params: Dict[str, List[str]], version: int) -> str:
+        return _dumps({'dataset_version': version, 'insights': self.analyzer.generate_strategic_insights()})
+
+    def categories(self, params: Dict[str, List[str]], version: int) -> str:
+        year = _int_param(params, 'year', None, 1900, 9999)
+        aggregates = _select_fields(self.analyzer.get_category_aggregates(year=year), params)
+        return f'{{"dataset_version":{version},"items":{_records(aggregates)}}}'
+
+    def etag(self, version: int, path: str, query: str) -> str:
+        """Strong validator for one representation: boot id, dataset version and a checksum of the request"""
+        return f'"{self.boot_id}-{version}-{zlib.crc32(f"{path}?{query}".encode()):08x}"'
+
+    def respond(self, path: str, query: str) -> Tuple[str, bytes]:
+        """ETag and body for a request, serialized at most once per dataset version"""
+        if path not in self.routes:
+            raise APIError(404, f"Unknown endpoint '{path}'")
+        version = self.analyzer.dataset_version
+        key = (version, path, query)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        params = parse_qs(query)
+        body = self.routes[path](params, version).encode()
+        entry = (self.etag(version, path, query), body)
+        if self.analyzer.dataset_version != version:
+            # Data was replaced mid-request; serve this body but do not keep it
+            return entry
+        with self._lock:
+            self._cache[key] = entry
+            while len(self._cache) > RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return entry
+
+
+class SupplyChainRequestHandler(BaseHTTPRequestHandler):
+    """Serves GET requests for the API attached to the server"""
+
+    server_version = 'SupplyChainAPI/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        api: SupplyChainAPI = self.server.api
+        url = urlsplit(self.path)
+        path = url.path.rstrip('/') or '/'
+
+        # Conditional requests are answered from the version alone, before any data is read
+        if path in api.routes:
+            etag = api.etag(api.analyzer.dataset_version, path, url.query)
+            if etag in (tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')):
+                self._send(304, b'', etag)
+                return
+
+        try:
+            etag, body = api.respond(path, url.query)
+        except APIError as exc:
+            self._send(exc.status, _dumps({'error': exc.message}).encode())
+            return
+        self._send(200, body, etag)
+
+    def _send(self, status: int, body: bytes, etag: Optional[str] = None):
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+            # Clients may keep the response but must revalidate, which is a cheap 304
+            self.send_header('Cache-Control', 'no-cache')
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def create_server(
+    analyzer: AdvancedSupplyChainAnalyzer,
+    host: str = '127.0.0.1',
+    port: int = 8502,
+    quiet: bool = False
+) -> ThreadingHTTPServer:
+    """HTTP server for the analyzer; call serve_forever() on it, port 0 picks a free port"""
+    server = ThreadingHTTPServer((host, port), SupplyChainRequestHandler)
+    server.daemon_threads = True
+    server.api = SupplyChainAPI(analyzer)
+    server.quiet = quiet
+    return server
+
+
+def load_analyzer() -> AdvancedSupplyChainAnalyzer:
+    """Analyzer with the same optional snapshot and SQLite sources as the dashboard"""
+    analyzer = AdvancedSupplyChainAnalyzer()
+    snapshot_path = os.environ.get('SUPPLY_CHAIN_SNAPSHOT')
+    if snapshot_path:
+        if os.path.exists(os.path.join(snapshot_path, 'manifest.json')):
+            analyzer.load_snapshot(snapshot_path)
+        else:
+            analyzer.save_snapshot(snapshot_path)
+    storage_path = os.environ.get('SUPPLY_CHAIN_DB')
+    if storage_path:
+        analyzer.attach_storage(storage_path)
+    return analyzer
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve supply chain data as JSON')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--quiet', action='store_true', help='do not log each request')
+    args = parser.parse_args()
+
+    server = create_server(load_analyzer(), args.host, args.port, args.quiet)
+    print(f"Serving supply chain API on http://{args.host}:{server.server_address[1]}/api/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
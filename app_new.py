@@ -1,7 +1,10 @@
+import os
+import time
+from functools import partial
+
+script_start = time.perf_counter()
+
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-from analyzer import AdvancedSupplyChainAnalyzer
 
 # Page Configuration
 st.set_page_config(
@@ -11,296 +14,34 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for modern light theme
-st.markdown("""
-    <style>
-    /* Base theme colors and variables */
-    :root {
-        /* Primary colors */
-        --primary-color: #60a5fa;
-        --primary-light: #93c5fd;
-        --primary-dark: #3b82f6;
-        
-        /* Layout colors */
-        --background-color: #0f172a;
-        --surface-color: #1e293b;
-        --border-color: #334155;
-        
-        /* Layout spacing */
-        --content-padding: 1.5rem;
-        --grid-gap: 1rem;
-        --section-spacing: 2rem;
-        
-        /* Text colors */
-        --text-color: #f8fafc;
-        --text-secondary-color: #cbd5e1;
-        --text-muted: #94a3b8;
-        
-        /* Accent colors */
-        --accent-color: #38bdf8;
-        --accent-light: #7dd3fc;
-        
-        /* Status colors */
-        --success-color: #4ade80;
-        --warning-color: #fbbf24;
-        --error-color: #f87171;
-        
-        /* Card and surface colors */
-        --metric-bg-color: #1e293b;
-        --card-hover-bg: #334155;
-        
-        /* Shadows */
-        --card-shadow: rgba(0, 0, 0, 0.25) 0px 1px 3px, rgba(0, 0, 0, 0.15) 0px 1px 2px;
-        --hover-shadow: rgba(0, 0, 0, 0.35) 0px 4px 12px, rgba(0, 0, 0, 0.25) 0px 2px 4px;
-        
-        /* Chart colors */
-        --chart-color-1: #60a5fa;
-        --chart-color-2: #4ade80;
-        --chart-color-3: #fbbf24;
-        --chart-color-4: #f87171;
-        --chart-color-5: #c084fc;
-    }
-
-    /* Dashboard containers and charts */
-    div[data-testid="stPlotlyChart"], 
-    div.stGraph,
-    .chart-container {
-        background: var(--surface-color);
-        padding: 1.5rem;
-        border-radius: 0.75rem;
-        border: 1px solid var(--border-color);
-        margin: 1rem 0;
-        box-shadow: var(--card-shadow);
-        min-height: 300px;
-        height: auto !important;
-        width: 100% !important;
-        transition: all 0.2s ease-in-out;
-        margin-bottom: 2rem;
-    }
-
-    div[data-testid="stPlotlyChart"]:hover, 
-    div.stGraph:hover,
-    .chart-container:hover {
-        box-shadow: var(--hover-shadow);
-        border-color: var(--primary-light);
-    }
-
-    /* Force plotly chart visibility */
-    .plotly-graph-div,
-    .js-plotly-plot,
-    .plot-container,
-    .plotly,
-    [class*="View"] {
-        display: block !important;
-        visibility: visible !important;
-        opacity: 1 !important;
-    }
-    
-    .stApp {
-        background: var(--background-color);
-    }
-    
-    .main .block-container {
-        padding: 2rem;
-        max-width: 95%;
-        margin: 0 auto;
-    }
-    
-    /* Add spacing between sections */
-    .element-container {
-        margin-bottom: 2rem !important;
-    }
-    
-    /* Table/DataFrame styling */
-    .stDataFrame {
-        font-size: 1.1rem !important;
-        border-radius: 0.5rem !important;
-        overflow: hidden !important;
-        border: 1px solid var(--border-color) !important;
-        background: var(--surface-color) !important;
-    }
-    
-    div[data-testid="stTable"] th {
-        font-weight: 600 !important;
-        background-color: var(--surface-color) !important;
-        color: var(--text-color) !important;
-        border-bottom: 2px solid var(--border-color) !important;
-        padding: 1rem !important;
-    }
-    
-    div[data-testid="stTable"] td {
-        color: var(--text-secondary-color) !important;
-        border-bottom: 1px solid var(--border-color) !important;
-        padding: 0.75rem 1rem !important;
-    }
-    
-    div[data-testid="stTable"] tr:hover {
-        background-color: var(--card-hover-bg) !important;
-    }
-
-    /* Metric container styling */
-    div[data-testid="metric-container"] {
-        background-color: var(--surface-color);
-        border: 1px solid var(--border-color);
-        padding: 1.5rem;
-        border-radius: 0.75rem;
-        width: 100%;
-        box-shadow: var(--card-shadow);
-        transition: all 0.2s ease-in-out;
-    }
-
-    div[data-testid="metric-container"]:hover {
-        transform: translateY(-2px);
-        box-shadow: var(--hover-shadow);
-        border-color: var(--primary-color);
-        background-color: var(--card-hover-bg);
-    }
-
-    div[data-testid="metric-container"] > div:first-child {
-        font-size: 1.2rem;
-        font-weight: 600;
-        color: var(--text-secondary-color);
-        margin-bottom: 0.5rem;
-    }
-
-    div[data-testid="metric-container"] > div:nth-child(2),
-    div[data-testid="stMetricValue"] {
-        font-size: 2.4rem !important;
-        font-weight: 700 !important;
-        color: var(--text-color) !important;
-        line-height: 1.2 !important;
-        margin: 0.5rem 0 !important;
-        opacity: 1 !important;
-    }
-
-    /* Metric delta styling */
-    div[data-testid="stMetricDelta"] {
-        font-size: 1.2rem !important;
-    }
-
-    div[data-testid="stMetricDelta"] > div {
-        display: flex !important;
-        flex-direction: row !important;
-        align-items: center !important;
-        justify-content: flex-start !important;
-        gap: 0.2rem !important;
-        color: var(--text-color) !important;
-        opacity: 1 !important;
-    }
-
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(to right, var(--primary-color), var(--primary-dark)) !important;
-        color: var(--background-color) !important;
-        border: none !important;
-        padding: 0.75rem 1.5rem !important;
-        border-radius: 0.5rem !important;
-        font-weight: 600 !important;
-        transition: all 0.2s ease !important;
-    }
-
-    .stButton > button:hover {
-        filter: brightness(110%) !important;
-        box-shadow: 0 0 15px rgba(96, 165, 250, 0.3) !important;
-    }
-
-    /* Chart and container adjustments for dark theme */
-    div[data-testid="stPlotlyChart"], 
-    div.stGraph,
-    .chart-container {
-        background: var(--surface-color);
-        border: 1px solid var(--border-color);
-        box-shadow: var(--card-shadow);
-    }
-
-    /* Sidebar styling */
-    .stSidebar [data-testid="stSidebarNav"] {
-        background-color: var(--surface-color);
-        border-right: 1px solid var(--border-color);
-    }
-
-    .stSidebar .stRadio > div {
-        background-color: var(--surface-color);
-        border: 1px solid var(--border-color);
-    }
-
-    .stSidebar .stRadio > div:hover {
-        background-color: var(--card-hover-bg);
-        border-color: var(--primary-color);
-    }
-
-    /* Search input styling */
-    .stTextInput > div > div > input {
-        background-color: var(--surface-color);
-        border: 1px solid var(--border-color);
-        color: var(--text-color);
-    }
-
-    .stTextInput > div > div > input:focus {
-        border-color: var(--primary-color);
-        box-shadow: 0 0 0 3px rgba(96, 165, 250, 0.2);
-    }
+# Custom CSS for modern light theme, read once per server process
+@st.cache_resource
+def load_stylesheet() -> str:
+    """Read the dashboard stylesheet"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'style.css')) as f:
+        return f.read()
 
-    /* Select box styling */
-    .stSelectbox > div > div {
-        background-color: var(--surface-color);
-        border: 1px solid var(--border-color);
-        color: var(--text-color);
-    }
-
-    .stSelectbox > div > div:hover {
-        border-color: var(--primary-color);
-    }
-
-    /* Tab styling */
-    .stTabs [data-baseweb="tab"] {
-        color: var(--text-secondary-color);
-    }
-
-    .stTabs [data-baseweb="tab"]:hover {
-        color: var(--primary-color);
-        background-color: var(--card-hover-bg);
-    }
-
-    .stTabs [data-baseweb="tab"][aria-selected="true"] {
-        color: var(--primary-color);
-        border-bottom-color: var(--primary-color);
-        background-color: var(--card-hover-bg);
-    }
-
-    /* Warning message styling */
-    .stAlert {
-        background-color: var(--surface-color);
-        color: var(--text-color);
-        border: 1px solid var(--border-color);
-    }
-
-    /* Plotly chart adjustments */
-    .js-plotly-plot .plotly {
-        background-color: var(--surface-color) !important;
-    }
-
-    .js-plotly-plot .plot-container {
-        color: var(--text-color) !important;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-# Initialize session state and load data
-if 'analyzer' not in st.session_state:
-    st.session_state.analyzer = AdvancedSupplyChainAnalyzer()
-    with st.spinner("Loading analytics..."):
-        st.session_state.analyzer.generate_realistic_data()
-        st.session_state.analyzer.calculate_advanced_metrics()
+st.markdown(f"<style>{load_stylesheet()}</style>", unsafe_allow_html=True)
 
-analyzer = st.session_state.analyzer
-data = analyzer.get_supply_chain_data()
-
-# Process date/year information once
-if 'Date' in data.columns:
-    data['Year'] = pd.to_datetime(data['Date']).dt.year
-elif 'Month' in data.columns:
-    data['Year'] = pd.to_datetime(data['Month']).dt.year
+def get_analyzer():
+    """Session analyzer; the module and its datasets load lazily on first access"""
+    if 'analyzer' not in st.session_state:
+        from analyzer import AdvancedSupplyChainAnalyzer
+        
+        analyzer = AdvancedSupplyChainAnalyzer()
+        # Optional on-disk snapshot: memory-map computed datasets, writing them on first start
+        snapshot_path = os.environ.get('SUPPLY_CHAIN_SNAPSHOT')
+        if snapshot_path:
+            if os.path.exists(os.path.join(snapshot_path, 'manifest.json')):
+                analyzer.load_snapshot(snapshot_path)
+            else:
+                analyzer.save_snapshot(snapshot_path)
+        # Optional SQLite backend: reuse a populated database instead of regenerating
+        storage_path = os.environ.get('SUPPLY_CHAIN_DB')
+        if storage_path:
+            analyzer.attach_storage(storage_path)
+        st.session_state.analyzer = analyzer
+    return st.session_state.analyzer
 
 # Sidebar configuration
 with st.sidebar:
@@ -312,46 +53,27 @@ with st.sidebar:
     
     selected_dashboard = st.radio(
         "### Dashboards",
-        ["Supplier Analytics", "Supply Chain Performance", "Risk Management"],
+        ["Supplier Analytics", "Supply Chain Performance", "Risk Management", "Supplier Drill-down"],
         label_visibility="collapsed"
     )
     
     st.markdown("<div style='height: 2rem;'></div>", unsafe_allow_html=True)
     
-    current_year = pd.Timestamp.now().year
-    selected_year = st.selectbox(
-        "### Time Period",
-        options=range(current_year-2, current_year+1),
-        index=2,
-        help="Select year for analysis"
-    )
+    # Filled with the month-range slider once the data (and so its months) has loaded
+    period_slot = st.container()
     
     st.markdown("<div style='height: 1rem;'></div>", unsafe_allow_html=True)
     
     if st.button("📊 Export Dashboard", use_container_width=True):
         st.download_button(
             label="Download Report",
-            data=analyzer.export_report(),
-            file_name=f"supply_chain_report_{selected_year}.xlsx",
+            data=get_analyzer().export_report(),
+            file_name="supply_chain_report_{}_{}.xlsx".format(*st.session_state.get('month_range', ('all', 'months'))),
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         )
-
-# Filter data for selected year
-filtered_data = data[data['Year'] == selected_year].copy()
-
-# Aggregate metrics if needed
-if 'Annual_Volume_USD' in filtered_data.columns and 'Total_Volume_USD' not in filtered_data.columns:
-    filtered_data['Total_Volume_USD'] = filtered_data['Annual_Volume_USD']
-
-required_columns = ['Category', 'Total_Volume_USD', 'Overall_Performance_Score', 'Supply_Risk_Score']
-if all(col in filtered_data.columns for col in required_columns):
-    filtered_data = filtered_data.groupby(['Supplier_Name', 'Category'])[
-        ['Total_Volume_USD', 'Overall_Performance_Score', 'Supply_Risk_Score']
-    ].agg({
-        'Total_Volume_USD': 'sum',
-        'Overall_Performance_Score': 'mean',
-        'Supply_Risk_Score': 'mean'
-    }).reset_index()
+    
+    # Filled with the Arrow / Parquet download once the analyzer has loaded
+    export_slot = st.container()
 
 # Main dashboard header with enhanced card design
 st.markdown(f"""
@@ -395,39 +117,207 @@ st.markdown(f"""
         '>Comprehensive analytics and insights for your supply chain management</p>
     </div>
 """, unsafe_allow_html=True)
+render_timings = {'first_paint': time.perf_counter() - script_start}
+
+# Load pandas, the analyzer and data only after the header has been sent so the page paints first
+with st.spinner("Loading analytics..."):
+    import pandas as pd
+    from ranking import top_n
+    from table_view import page_count, styled_page, table_page
+    from currency import currency_symbol
+    
+    analyzer = get_analyzer()
+    # Rebase before any dataset is read, so every section sees the same currency
+    if st.session_state.get('reporting_currency', analyzer.reporting_currency) != analyzer.reporting_currency:
+        analyzer.rebase_currency(st.session_state.reporting_currency)
+    data = analyzer.get_supply_chain_data()
+render_timings['data_ready'] = time.perf_counter() - script_start
+st.session_state.render_timings = render_timings
+
+# Surface records rejected by the ingest validation instead of charting them
+validation = analyzer.last_validation
+if validation is not None and not validation.passed:
+    with st.sidebar.expander(f"⚠️ {len(validation.quarantine):,} records quarantined"):
+        st.dataframe(validation.report.loc[validation.report['Status'] != 'passed', ['Rule', 'Status', 'Violations']],
+                     hide_index=True, use_container_width=True)
+
+# Month range, defaulting to the latest twelve months
+months = analyzer.available_months()
+selected_range = period_slot.select_slider(
+    "### Time Period",
+    options=months,
+    value=(months[max(0, len(months) - 12)], months[-1]),
+    key='month_range',
+    help="Select the months to analyse"
+)
+start_month, end_month = selected_range
+
+# Spend per supplier over the range comes from running totals: no pass over the monthly records
+range_spend = analyzer.get_range_aggregates(start_month, end_month, how='sum', metrics=['Total_Cost_USD'])
+months_reported = analyzer.get_range_aggregates(start_month, end_month, how='count', metrics=['Total_Cost_USD'])
+active = months_reported['Total_Cost_USD'] > 0
+filtered_data = data[data['Supplier_ID'].isin(active.index[active])].assign(
+    Total_Volume_USD=lambda frame: frame['Supplier_ID'].map(range_spend['Total_Cost_USD'])
+)
+period_slot.caption(f"{analyzer.get_monthly_range(start_month, end_month).shape[0]:,} monthly records "
+                   f"from {active.sum():,} suppliers")
+currencies = analyzer.currency_converter.currencies
+period_slot.selectbox(
+    "Reporting Currency",
+    currencies,
+    index=currencies.index(analyzer.reporting_currency),
+    key='reporting_currency',
+    disabled=analyzer.storage is not None,
+    help="Amounts convert at each month's FX rate from the local rates table"
+)
+fx_latest = analyzer.currency_converter.latest_month
+if months and months[-1] > fx_latest:
+    period_slot.caption(f"⚠️ FX rates end at {fx_latest}; conversions for later months use the {fx_latest} rates")
 
-# SINGLE ROW OF METRICS - Using Streamlit's built-in metrics
-if selected_dashboard == "Supplier Analytics":
+# Full-size columnar exports; the file is only written when the download is clicked
+with export_slot.expander("🗂️ Export Data (Arrow / Parquet)"):
+    from columnar import COLUMNAR_FORMATS, COMPRESSIONS
+    
+    export_dataset = st.selectbox("Dataset", list(analyzer.EXPORT_DATASETS), key='export_dataset',
+                                  format_func={'supply_chain': "Supply chain (per supplier)",
+                                               'monthly': "Monthly facts"}.get)
+    export_format = st.radio("Format", list(COLUMNAR_FORMATS), key='export_format', horizontal=True,
+                             format_func={'arrow': "Arrow IPC", 'parquet': "Parquet"}.get)
+    export_compression = st.selectbox("Compression", COMPRESSIONS[export_format], key=f'export_compression_{export_format}')
+    extension, mime = COLUMNAR_FORMATS[export_format]
+    st.download_button(
+        label="Download",
+        data=partial(analyzer.export_columnar, export_dataset, export_format, export_compression),
+        file_name=f"supply_chain_{export_dataset}.{extension}",
+        mime=mime,
+        use_container_width=True
+    )
+
+required_columns = ['Category', 'Total_Volume_USD', 'Overall_Performance_Score', 'Supply_Risk_Score']
+if all(col in filtered_data.columns for col in required_columns):
+    group_columns = ['Supplier_Name', 'Category'] + (['Segment'] if 'Segment' in filtered_data.columns else [])
+    filtered_data = filtered_data.groupby(group_columns)[
+        ['Total_Volume_USD', 'Overall_Performance_Score', 'Supply_Risk_Score']
+    ].agg({
+        'Total_Volume_USD': 'sum',
+        'Overall_Performance_Score': 'mean',
+        'Supply_Risk_Score': 'mean'
+    }).reset_index()
+
+
+# Suppliers offered in the drill-down picker at once; the search box narrows larger portfolios
+DRILLDOWN_OPTIONS = 200
+
+@st.fragment
+def render_supplier_drilldown(analyzer, data):
+    """One supplier's profile and full monthly history; inputs: analyzer datasets plus the picker"""
+    search = st.text_input("🔍 Find a supplier by ID or name", key='drilldown_search')
+    candidates = data[['Supplier_ID', 'Supplier_Name']]
+    if search:
+        needle = search.lower()
+        matches = (candidates['Supplier_ID'].str.lower().str.contains(needle, regex=False)
+                   | candidates['Supplier_Name'].str.lower().str.contains(needle, regex=False))
+        candidates = candidates[matches]
+    if candidates.empty:
+        st.info("No supplier matches the search.")
+        return
+    
+    names = dict(zip(candidates['Supplier_ID'].head(DRILLDOWN_OPTIONS), candidates['Supplier_Name'].head(DRILLDOWN_OPTIONS)))
+    supplier_id = st.selectbox("Supplier", list(names), format_func=lambda sid: f"{sid} · {names[sid]}",
+                               key='drilldown_supplier')
+    if len(candidates) > DRILLDOWN_OPTIONS:
+        st.caption(f"Showing the first {DRILLDOWN_OPTIONS:,} of {len(candidates):,} matches; refine the search to see others.")
+    
+    profile = data.loc[data['Supplier_ID'] == supplier_id].iloc[0]
+    history = analyzer.get_supplier_history(supplier_id)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Category", profile['Category'], help=f"{profile['Country']} · {profile['Supplier_Tier']}")
+    with col2:
+        st.metric("Performance", f"{profile['Overall_Performance_Score']:.1f}%")
+    with col3:
+        st.metric("Risk Score", f"{profile['Supply_Risk_Score']:.1f}")
+    with col4:
+        st.metric("Months Reported", len(history))
+    
+    if history.empty:
+        st.info("No monthly records for this supplier.")
+        return
+    st.plotly_chart(analyzer.create_supplier_history_chart(history, f"{names[supplier_id]}: Monthly History"),
+                    use_container_width=True)
+    with st.expander("Monthly records"):
+        st.dataframe(history, hide_index=True, use_container_width=True)
+
+
+# The drill-down is its own page: none of the overview figures below are needed for it
+if selected_dashboard == "Supplier Drill-down":
+    render_supplier_drilldown(analyzer, data)
+    st.stop()
+
+
+# Every chart on the page is independent, so they are built together, slowest first,
+# with the figure pool running the others in worker processes when cores are spare
+@st.cache_resource
+def get_figure_pool():
+    """Per-server figure worker pool, warmed up in the background"""
+    from figure_pool import FigurePool
+    return FigurePool()
+
+figure_jobs = {'overview': ('create_modern_dashboard', (filtered_data,), {})}
+if 'Total_Volume_USD' in filtered_data.columns:
+    volume_data = filtered_data.groupby('Category')['Total_Volume_USD'].sum().reset_index()
+    figure_jobs['volume'] = ('create_volume_chart', (volume_data,), {})
+
+# Prepare risk matrix data
+risk_columns = ['Supplier_Name', 'Overall_Performance_Score', 'Supply_Risk_Score', 'Total_Volume_USD']
+if 'Segment' in filtered_data.columns:
+    risk_columns.append('Segment')
+risk_matrix = filtered_data[risk_columns].copy()
+risk_matrix['Bubble_Size'] = risk_matrix['Total_Volume_USD'].apply(lambda x: max(10, min(60, x/100000)))
+figure_jobs['risk'] = ('create_risk_matrix', (risk_matrix,),
+                       {'color_by': 'Segment' if 'Segment' in risk_matrix.columns else None})
+
+build_start = time.perf_counter()
+figures = get_figure_pool().build(analyzer, figure_jobs)
+render_timings['figures'] = time.perf_counter() - build_start
+
+
+# Each section is a fragment: interacting with a widget inside one reruns only that
+# section, while sidebar changes still rerun the whole page with fresh inputs.
+@st.fragment
+def render_header_kpis(analyzer, filtered_data):
+    """Headline KPI row; inputs: sidebar-filtered supplier frame"""
     # Calculate metrics
     total_suppliers = filtered_data['Supplier_Name'].nunique()
     total_spend = filtered_data['Total_Volume_USD'].sum()
     avg_performance = filtered_data['Overall_Performance_Score'].mean()
     avg_risk = filtered_data['Supply_Risk_Score'].mean()
-    
+
     # Display in a single row using columns
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         st.metric(
             label="Total Suppliers",
             value=total_suppliers,
             delta=analyzer.get_supplier_growth() if hasattr(analyzer, 'get_supplier_growth') else None
         )
-    
+
     with col2:
         st.metric(
             label="Total Spend",
-            value=f"${total_spend:,.0f}",
+            value=f"{currency_symbol(analyzer.reporting_currency)}{total_spend:,.0f}",
             delta=f"{analyzer.get_volume_growth()}" if hasattr(analyzer, 'get_volume_growth') else None
         )
-    
+
     with col3:
         st.metric(
             label="Avg. Performance",
             value=f"{avg_performance:.1f}%",
             delta=f"{analyzer.get_performance_change()}" if hasattr(analyzer, 'get_performance_change') else None
         )
-    
+
     with col4:
         st.metric(
             label="Avg. Risk Score",
@@ -436,20 +326,15 @@ if selected_dashboard == "Supplier Analytics":
             delta_color="inverse"  # Lower risk is better
         )
 
-# Add spacing
-st.markdown("<hr style='margin: 2rem 0; opacity: 0.2;'>", unsafe_allow_html=True)
-
-# Dashboard tabs
-tab1, tab2, tab3 = st.tabs(["Performance Overview", "Detailed Analysis", "Strategic Insights"])
 
-with tab1:
-   
-    
+@st.fragment
+def render_overview_charts(figures):
+    """Overview dashboard and volume chart; inputs: figures prebuilt for this run"""
     # Create container for the chart using columns
     st.markdown("<div style='margin: 4rem 0;'>", unsafe_allow_html=True)
     container = st.container()
     with container:
-        fig = analyzer.create_modern_dashboard(filtered_data)
+        fig = figures['overview']
         # Update figure layout with more breathing room
         fig.update_layout(
             height=900,  # Increased height for better visibility
@@ -473,10 +358,10 @@ with tab1:
             }
         )
     st.markdown("</div>", unsafe_allow_html=True)
-    
+
     # Add substantial spacing between charts
     st.markdown("<div style='height: 6rem;'></div>", unsafe_allow_html=True)
-    
+
     # Volume distribution
     st.markdown("""
         <div style='margin: 3rem 0 1.5rem 0;'>
@@ -484,9 +369,8 @@ with tab1:
             <p style='color: var(--text-secondary-color); margin-top: 0.5rem; font-size: 0.9rem;'>Distribution of total volume across different categories</p>
         </div>
     """, unsafe_allow_html=True)
-    if 'Total_Volume_USD' in filtered_data.columns:
-        volume_data = filtered_data.groupby('Category')['Total_Volume_USD'].sum().reset_index()
-        volume_fig = analyzer.create_volume_chart(volume_data)
+    if 'volume' in figures:
+        volume_fig = figures['volume']
         # Update volume chart layout with more spacing
         volume_fig.update_layout(
             height=500,  # Increased height
@@ -502,69 +386,79 @@ with tab1:
             config={'displayModeBar': False}
         )
         st.markdown("</div>", unsafe_allow_html=True)
-        
+
         # Add extra spacing after the volume chart
         st.markdown("<div style='height: 3rem;'></div>", unsafe_allow_html=True)
     else:
         st.warning("Volume data is not available. Please ensure the data is fully loaded.")
 
-# Add detailed data table with increased spacing
-st.markdown("<div style='height: 5rem;'></div>", unsafe_allow_html=True)
-st.markdown("""
-    <div style='margin: 3rem 0 2rem 0;'>
-        <h3 style='color: var(--text-color); font-size: 1.2rem; font-weight: 600;'>Detailed Supply Chain Data</h3>
-        <p style='color: var(--text-secondary-color); margin-top: 0.5rem; font-size: 0.9rem;'>Comprehensive view of all supplier metrics</p>
-    </div>
-""", unsafe_allow_html=True)
 
-# Add search and filter options
-search = st.text_input("🔍 Search Suppliers")
-if search:
-    filtered_data = filtered_data[
-        filtered_data['Supplier_Name'].str.contains(search, case=False) |
-        filtered_data['Category'].str.contains(search, case=False)
-    ]
+@st.fragment
+def render_table(filtered_data, currency: str):
+    """Searchable, paginated supplier table; inputs: sidebar-filtered frame, currency symbol and its own widgets"""
+    # Add detailed data table with increased spacing
+    st.markdown("<div style='height: 5rem;'></div>", unsafe_allow_html=True)
+    st.markdown("""
+        <div style='margin: 3rem 0 2rem 0;'>
+            <h3 style='color: var(--text-color); font-size: 1.2rem; font-weight: 600;'>Detailed Supply Chain Data</h3>
+            <p style='color: var(--text-secondary-color); margin-top: 0.5rem; font-size: 0.9rem;'>Comprehensive view of all supplier metrics</p>
+        </div>
+    """, unsafe_allow_html=True)
 
-# Display the filtered data in a modern table with styling
-styled_df = filtered_data[[
-    'Supplier_Name', 'Category', 'Total_Volume_USD',
-    'Overall_Performance_Score', 'Supply_Risk_Score'
-]].copy()
-
-# Add styling
-styled_df = styled_df.style\
-    .format({
-        'Total_Volume_USD': '${:,.2f}',
-        'Overall_Performance_Score': '{:.1f}%',
-        'Supply_Risk_Score': '{:.1f}'
-    })\
-    .background_gradient(
-        subset=['Overall_Performance_Score'], 
-        cmap='RdYlGn',
-        vmin=0,
-        vmax=100
-    )\
-    .background_gradient(
-        subset=['Supply_Risk_Score'],
-        cmap='RdYlGn_r',
-        vmin=0,
-        vmax=100
+    # Add search and filter options
+    search = st.text_input("🔍 Search Suppliers", key='table_search')
+    if search:
+        filtered_data = filtered_data[
+            filtered_data['Supplier_Name'].str.contains(search, case=False) |
+            filtered_data['Category'].str.contains(search, case=False)
+        ]
+
+    # Server-side sorted, paginated table; only the visible page is colored and rendered
+    table_columns = [
+        'Supplier_Name', 'Category', 'Total_Volume_USD',
+        'Overall_Performance_Score', 'Supply_Risk_Score'
+    ]
+    sort_col, order_col, size_col, page_col = st.columns([2, 1, 1, 1])
+    with sort_col:
+        sort_by = st.selectbox("Sort by", table_columns, index=2, key='table_sort_by')
+    with order_col:
+        descending = st.toggle("Descending", value=True, key='table_descending')
+    with size_col:
+        page_size = st.selectbox("Rows per page", [25, 50, 100], index=0, key='table_page_size')
+    with page_col:
+        total_pages = page_count(len(filtered_data), page_size)
+        page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, step=1, key='table_page')
+
+    table = table_page(filtered_data[table_columns], sort_by, descending, int(page), page_size)
+    st.dataframe(
+        styled_page(table, {
+            'Overall_Performance_Score': (0, 100, False),
+            'Supply_Risk_Score': (0, 100, True)
+        }),
+        use_container_width=True,
+        hide_index=True,
+        height=350,  # Slightly reduced height
+        column_config={
+            'Supplier_Name': st.column_config.TextColumn("Supplier"),
+            'Category': st.column_config.TextColumn("Category"),
+            'Total_Volume_USD': st.column_config.NumberColumn("Total Volume", format=f"{currency}%.2f"),
+            'Overall_Performance_Score': st.column_config.NumberColumn("Performance", format="%.1f%%"),
+            'Supply_Risk_Score': st.column_config.NumberColumn("Risk Score", format="%.1f")
+        }
     )
+    st.caption(f"Page {min(int(page), total_pages)} of {total_pages} · {len(filtered_data):,} suppliers")
 
-st.dataframe(
-    styled_df,
-    use_container_width=True,
-    height=350  # Slightly reduced height
-)
 
-with tab2:
+@st.fragment
+def render_risk_tab(analyzer, filtered_data, figures):
+    """Risk matrix and outlook; inputs: sidebar-filtered supplier frame and prebuilt figures"""
     st.markdown("""
         <div style='margin: 0.5rem 0 1rem 0;'>
             <h2 style='color: var(--text-color); font-size: 1.4rem; font-weight: 600;'>Detailed Analysis</h2>
             <p style='color: var(--text-secondary-color); margin-top: 0.25rem; font-size: 0.9rem;'>In-depth analysis of supplier performance and distribution</p>
         </div>
     """, unsafe_allow_html=True)
-    
+
     # Risk Analysis Matrix
     st.markdown("""
         <div style='margin: 0.5rem 0;'>
@@ -572,12 +466,8 @@ with tab2:
             <p style='color: var(--text-secondary-color); margin-top: 0.25rem; font-size: 0.9rem;'>Performance vs Risk analysis of suppliers</p>
         </div>
     """, unsafe_allow_html=True)
-    
-    # Prepare risk matrix data
-    risk_matrix = filtered_data[['Supplier_Name', 'Overall_Performance_Score', 'Supply_Risk_Score', 'Total_Volume_USD']].copy()
-    risk_matrix['Bubble_Size'] = risk_matrix['Total_Volume_USD'].apply(lambda x: max(10, min(60, x/100000)))
-    
-    risk_fig = analyzer.create_risk_matrix(risk_matrix)
+
+    risk_fig = figures['risk']
     risk_fig.update_layout(
         height=450,  # Reduced height
         margin=dict(t=20, l=50, r=50, b=50),  # Tighter margins
@@ -598,14 +488,85 @@ with tab2:
         config={'displayModeBar': False}
     )
 
-with tab3:
+    # Six-month outlook: suppliers whose forecast delivery and quality fall furthest
+    st.markdown("""
+        <div style='margin: 1.5rem 0 0.5rem 0;'>
+            <h3 style='color: var(--text-color); font-size: 1.2rem; font-weight: 600;'>6-Month Outlook</h3>
+            <p style='color: var(--text-secondary-color); margin-top: 0.25rem; font-size: 0.9rem;'>Forecast change against the last six months</p>
+        </div>
+    """, unsafe_allow_html=True)
+    outlook = analyzer.get_forecast_outlook()
+    outlook = outlook[outlook['Supplier_Name'].isin(filtered_data['Supplier_Name'])].assign(
+        Outlook_Change=lambda df: df['Delivery_Rate_Change'] + df['Quality_Score_Change']
+    )
+    st.dataframe(
+        top_n(outlook, 'Outlook_Change', 10, largest=False)[[
+            'Supplier_Name', 'Forecast_Delivery_Rate', 'Delivery_Rate_Change',
+            'Forecast_Quality_Score', 'Quality_Score_Change', 'Forecast_Volume_USD'
+        ]],
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'Supplier_Name': st.column_config.TextColumn("Supplier"),
+            'Forecast_Delivery_Rate': st.column_config.NumberColumn("Delivery Forecast", format="%.1f%%"),
+            'Delivery_Rate_Change': st.column_config.NumberColumn("Δ Delivery", format="%+.1f"),
+            'Forecast_Quality_Score': st.column_config.NumberColumn("Quality Forecast", format="%.1f"),
+            'Quality_Score_Change': st.column_config.NumberColumn("Δ Quality", format="%+.1f"),
+            'Forecast_Volume_USD': st.column_config.NumberColumn("Monthly Volume Forecast",
+                                                                  format=f"{currency_symbol(analyzer.reporting_currency)}%.0f")
+        }
+    )
+
+
+@st.fragment
+def render_rules_panel(analyzer):
+    """User alert rules; inputs: analyzer datasets plus the rule form"""
+    st.markdown("""
+        <div style='margin: 1.5rem 0 0.5rem 0;'>
+            <h3 style='color: var(--text-color); font-size: 1.2rem; font-weight: 600;'>Alert Rules</h3>
+            <p style='color: var(--text-secondary-color); margin-top: 0.25rem; font-size: 0.9rem;'>e.g. "Supply_Risk_Score > 70 and Annual_Volume_USD > 5M" or "Defect_Rate_PPM rising 3 months in a row"</p>
+        </div>
+    """, unsafe_allow_html=True)
+    with st.form('alert_rule_form', clear_on_submit=True):
+        name_col, rule_col = st.columns([1, 3])
+        with name_col:
+            rule_name = st.text_input("Rule name")
+        with rule_col:
+            rule_source = st.text_input("Condition")
+        if st.form_submit_button("Add rule") and rule_name and rule_source:
+            from rules import RuleSyntaxError
+            try:
+                analyzer.add_alert_rule(rule_name, rule_source)
+            except RuleSyntaxError as exc:
+                st.error(str(exc))
+
+    matches, summary = analyzer.evaluate_alert_rules()
+    st.dataframe(
+        summary,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'Matches': st.column_config.NumberColumn("Suppliers"),
+            'Milliseconds': st.column_config.NumberColumn("Eval (ms)", format="%.2f")
+        }
+    )
+    selected_rule = st.selectbox("Show suppliers matching", summary['Rule'], key='alert_rule_selected')
+    matched_ids = matches.index[matches[selected_rule].to_numpy()]
+    suppliers = analyzer.suppliers_data
+    st.dataframe(suppliers.loc[suppliers['Supplier_ID'].isin(matched_ids), ['Supplier_ID', 'Supplier_Name', 'Category']],
+                 hide_index=True, use_container_width=True)
+
+
+@st.fragment
+def render_insights_tab(analyzer):
+    """Strategic insights; inputs: analyzer datasets only"""
     st.markdown("""
         <div style='margin: 0.5rem 0 1rem 0;'>
             <h2 style='color: var(--text-color); font-size: 1.4rem; font-weight: 600;'>Strategic Insights</h2>
             <p style='color: var(--text-secondary-color); margin-top: 0.25rem; font-size: 0.9rem;'>Key findings and actionable recommendations</p>
         </div>
     """, unsafe_allow_html=True)
-    
+
     insights = analyzer.generate_strategic_insights()
     col1, col2 = st.columns(2)
     with col1:
@@ -616,8 +577,8 @@ with tab3:
             </div>
         """, unsafe_allow_html=True)
         summary_df = pd.DataFrame(insights['Executive Summary'].items(), columns=['Metric', 'Value'])
-        st.dataframe(summary_df, hide_index=True, use_container_width=True, height=200)
-    
+        st.dataframe(summary_df, hide_index=True, use_container_width=True, height=(len(summary_df) + 1) * 35 + 3)
+
     with col2:
         st.markdown("""
             <div style='margin-bottom: 0.5rem;'>
@@ -625,4 +586,97 @@ with tab3:
                 <p style='color: var(--text-secondary-color); font-size: 0.9rem; margin-bottom: 0.5rem;'>Strategic action items</p>
             </div>
         """, unsafe_allow_html=True)
-        st.dataframe(pd.DataFrame(insights['Key Recommendations']), hide_index=True, use_container_width=True)
\ No newline at end of file
+        st.dataframe(pd.DataFrame(insights['Key Recommendations']), hide_index=True, use_container_width=True)
+
+
+# Suppliers listed under the weight sliders
+SCORING_ROWS = 50
+
+@st.fragment
+def render_scoring_tab(analyzer):
+    """Re-weighted performance ranking; inputs: analyzer datasets plus the weight sliders"""
+    from scoring import DEFAULT_WEIGHTS
+    
+    st.markdown("""
+        <div style='margin: 0.5rem 0 1rem 0;'>
+            <h2 style='color: var(--text-color); font-size: 1.4rem; font-weight: 600;'>Custom Performance Score</h2>
+            <p style='color: var(--text-secondary-color); margin-top: 0.25rem; font-size: 0.9rem;'>Weight each component to re-rank the whole portfolio</p>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    weights = {}
+    columns = st.columns(3)
+    for i, (component, default) in enumerate(DEFAULT_WEIGHTS.items()):
+        with columns[i % 3]:
+            weights[component] = st.slider(component, 0.0, 10.0, default, step=0.5, key=f'score_weight_{component}')
+    
+    started = time.perf_counter()
+    ranked = analyzer.get_weighted_scores(weights, top=SCORING_ROWS)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    st.caption(f"Scored and ranked {len(analyzer.performance_scorer.supplier_ids):,} suppliers in {elapsed_ms:.1f} ms"
+               + ("" if sum(weights.values()) else " · all weights are zero, so components count equally"))
+    
+    component_columns = {component: st.column_config.NumberColumn(component, format="%.0f")
+                         for component in DEFAULT_WEIGHTS}
+    st.dataframe(
+        ranked.drop(columns='Supplier_ID'),
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'Supplier_Name': st.column_config.TextColumn("Supplier"),
+            'Weighted_Score': st.column_config.ProgressColumn("Weighted Score", format="%.1f", min_value=0, max_value=100),
+            **component_columns
+        }
+    )
+
+
+@st.fragment
+def render_alerts_panel(analyzer, filtered_data):
+    """EWMA anomaly alerts; inputs: sidebar-filtered suppliers plus the lookback widget"""
+    alerts = analyzer.get_anomaly_alerts(last_months=None)
+    alerts = alerts[alerts['Supplier_Name'].isin(filtered_data['Supplier_Name'])]
+    months = sorted(alerts['Month'].unique(), reverse=True)
+    with st.expander(f"🚨 Anomaly Alerts ({int((alerts['Month'] == months[0]).sum()) if months else 0} this month)"):
+        lookback = st.selectbox("Months", [1, 3, 6, 12], index=1, key='alerts_lookback')
+        recent = alerts[alerts['Month'].isin(months[:lookback])]
+        if recent.empty:
+            st.caption("No anomalous drops or spikes in this period.")
+            return
+        st.dataframe(
+            recent[['Month', 'Supplier_Name', 'Metric', 'Value', 'Expected', 'Z_Score']],
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                'Supplier_Name': st.column_config.TextColumn("Supplier"),
+                'Value': st.column_config.NumberColumn("Value", format="%.1f"),
+                'Expected': st.column_config.NumberColumn("Expected", format="%.1f"),
+                'Z_Score': st.column_config.NumberColumn("Deviation (σ)", format="%+.1f")
+            }
+        )
+
+
+# SINGLE ROW OF METRICS - Using Streamlit's built-in metrics
+if selected_dashboard == "Supplier Analytics":
+    render_header_kpis(analyzer, filtered_data)
+render_alerts_panel(analyzer, filtered_data)
+
+# Add spacing
+st.markdown("<hr style='margin: 2rem 0; opacity: 0.2;'>", unsafe_allow_html=True)
+
+# Dashboard tabs
+tab1, tab2, tab3, tab4 = st.tabs(["Performance Overview", "Detailed Analysis", "Strategic Insights", "Custom Scoring"])
+
+with tab1:
+    render_overview_charts(figures)
+
+render_table(filtered_data, currency_symbol(analyzer.reporting_currency))
+
+with tab2:
+    render_risk_tab(analyzer, filtered_data, figures)
+    render_rules_panel(analyzer)
+
+with tab3:
+    render_insights_tab(analyzer)
+
+with tab4:
+    render_scoring_tab(analyzer)
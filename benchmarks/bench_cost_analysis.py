@@ -0,0 +1,63 @@
+"""Benchmark the single-pass supplier cost analysis on 10M monthly rows.
+
+Two layouts of the records: sorted by supplier with a categorical
+Supplier_ID, and in arbitrary order with plain string IDs, as they come
+from a CSV file or an ingest.
+
+Run from the repository root: python benchmarks/bench_cost_analysis.py [rows] [suppliers]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzer import AdvancedSupplyChainAnalyzer  # noqa: E402
+
+
+def synthetic_monthly(n_rows, n_suppliers, sorted_categorical=True, seed=42):
+    """Monthly records, either sorted by supplier with a categorical Supplier_ID or unsorted with object IDs"""
+    rng = np.random.default_rng(seed)
+    ids = [f'SUP{i:06d}' for i in range(n_suppliers)]
+    codes = rng.integers(0, n_suppliers, n_rows)
+    if sorted_categorical:
+        supplier_ids = pd.Categorical.from_codes(np.sort(codes), ids)
+    else:
+        supplier_ids = np.array(ids, dtype=object)[codes]
+    frame = pd.DataFrame({
+        'Supplier_ID': supplier_ids,
+        'Date': (np.datetime64('2023-01', 'M') + rng.integers(0, 24, n_rows)).astype('datetime64[ns]')
+    })
+    for column in AdvancedSupplyChainAnalyzer.COST_ANALYSIS_MEANS.values():
+        frame[column] = rng.uniform(0, 100, n_rows)
+    suppliers = pd.DataFrame({'Supplier_ID': ids})
+    performance = pd.DataFrame({
+        'Supplier_ID': ids,
+        'Overall_Performance_Score': rng.uniform(60, 100, n_suppliers),
+        'Supply_Risk_Score': rng.uniform(0, 100, n_suppliers)
+    })
+    return suppliers, frame, performance
+
+
+def main(n_rows=10_000_000, n_suppliers=100_000):
+    analyzer = AdvancedSupplyChainAnalyzer()
+    print(f"rows: {n_rows:,}  suppliers: {n_suppliers:,}")
+
+    for layout, sorted_categorical in [('sorted, categorical IDs', True), ('unsorted, object IDs', False)]:
+        suppliers, monthly, performance = synthetic_monthly(n_rows, n_suppliers, sorted_categorical)
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            result = analyzer._compute_cost_analysis(suppliers, monthly, performance)
+            timings.append(time.perf_counter() - start)
+        print(f"{layout}: best {min(timings) * 1000:.0f} ms, worst {max(timings) * 1000:.0f} ms, "
+              f"output {result.shape}")
+        del suppliers, monthly, performance
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,44 @@
+"""Benchmark the supplier x month x metric cube against pandas group-bys.
+
+Run from the repository root: python benchmarks/bench_cube.py [rows] [suppliers]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube import MetricCube  # noqa: E402
+from bench_cost_analysis import synthetic_monthly  # noqa: E402
+
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main(n_rows=2_400_000, n_suppliers=100_000):
+    _, monthly, _ = synthetic_monthly(n_rows, n_suppliers)
+    metrics = [column for column in monthly.columns if column not in ('Supplier_ID', 'Date')]
+
+    start = time.perf_counter()
+    cube = MetricCube.from_frame(monthly, metrics, month_column='Date')
+    build_ms = (time.perf_counter() - start) * 1000
+
+    print(f"rows: {n_rows:,}  cube: {cube.shape}  ({cube.values.nbytes / 1e6:.0f} MB)  build {build_ms:.0f} ms")
+    print(f"supplier means   groupby {best_of(lambda: monthly.groupby('Supplier_ID', observed=True)[metrics].mean()):7.1f} ms"
+          f"   cube {best_of(lambda: cube.reduce('mean', over='month')):7.1f} ms")
+    print(f"monthly means    groupby {best_of(lambda: monthly.groupby('Date')[metrics].mean()):7.1f} ms"
+          f"   cube {best_of(lambda: cube.reduce('mean', over='supplier')):7.1f} ms")
+    supplier = cube.supplier_ids[n_suppliers // 2]
+    print(f"one supplier     filter  {best_of(lambda: monthly[monthly['Supplier_ID'] == supplier]):7.1f} ms"
+          f"   cube {best_of(lambda: cube.supplier_series(supplier)):7.3f} ms")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
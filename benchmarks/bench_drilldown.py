@@ -0,0 +1,47 @@
+"""Benchmark fetching one supplier's history: boolean filter against the supplier-sorted slice.
+
+Run from the repository root: python benchmarks/bench_drilldown.py [suppliers] [months]
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timeline import SupplierTimelines  # noqa: E402
+from generation import generate_monthly_data, synthetic_suppliers  # noqa: E402
+from bench_cube import best_of  # noqa: E402
+
+
+def main(n_suppliers=100_000, n_months=60):
+    monthly = generate_monthly_data(synthetic_suppliers(n_suppliers), n_months=n_months, now=datetime(2025, 1, 15))
+
+    start = time.perf_counter()
+    timelines = SupplierTimelines(monthly)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    rng = np.random.default_rng(0)
+    picks = timelines.supplier_ids[rng.integers(0, len(timelines.supplier_ids), 5)]
+
+    def scan(supplier_id):
+        return monthly[monthly['Supplier_ID'] == supplier_id].sort_values('Month', kind='stable')
+
+    # Same rows, same order
+    for supplier_id in picks:
+        expected, result = scan(supplier_id), timelines.history(supplier_id)
+        assert expected.reset_index(drop=True).equals(result.reset_index(drop=True)), supplier_id
+
+    print(f"rows: {len(monthly):,}  suppliers: {n_suppliers:,}  months: {n_months}  "
+          f"index build {build_ms:.0f} ms (once per dataset)")
+    for supplier_id in picks:
+        print(f"  {supplier_id}: filter {best_of(lambda: scan(supplier_id)):7.1f} ms   "
+              f"slice {best_of(lambda: timelines.history(supplier_id)) * 1000:6.1f} us")
+    print("OK")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
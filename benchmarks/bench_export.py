@@ -0,0 +1,52 @@
+"""Benchmark writing and reading the monthly facts as XLSX, Arrow IPC and Parquet.
+
+Run from the repository root: python benchmarks/bench_export.py [suppliers] [months]
+"""
+import io
+import os
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from columnar import COMPRESSIONS, export_frame, read_frame  # noqa: E402
+from generation import generate_monthly_data, synthetic_suppliers  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def write_xlsx(frame):
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        frame.to_excel(writer, sheet_name='Monthly', index=False)
+    return output.getvalue()
+
+
+def main(n_suppliers=2_000, n_months=24):
+    monthly = generate_monthly_data(synthetic_suppliers(n_suppliers), n_months=n_months, now=datetime(2025, 1, 15))
+    print(f"rows: {len(monthly):,}  columns: {monthly.shape[1]}  in memory: {monthly.memory_usage(deep=True).sum() / 2**20:.1f} MB")
+
+    data, write_ms = timed(lambda: write_xlsx(monthly))
+    _, read_ms = timed(lambda: pd.read_excel(io.BytesIO(data)))
+    print(f"  {'xlsx':<16} write {write_ms:8.0f} ms  read {read_ms:8.0f} ms  size {len(data) / 2**20:6.2f} MB")
+
+    for fmt, codecs in COMPRESSIONS.items():
+        for codec in codecs:
+            data, write_ms = timed(lambda: export_frame(monthly, fmt, codec))
+            result, read_ms = timed(lambda: read_frame(data, fmt))
+            assert result.equals(monthly), (fmt, codec)
+            print(f"  {fmt + ' ' + codec:<16} write {write_ms:8.0f} ms  read {read_ms:8.0f} ms  "
+                  f"size {len(data) / 2**20:6.2f} MB")
+    print("OK")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
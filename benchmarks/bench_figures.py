@@ -0,0 +1,63 @@
+"""Compare building the dashboard figures one after another with the figure pool.
+
+The pool only helps with spare cores: on a single-core machine both timings
+are about the same, plus a little pickling overhead for the pooled build.
+
+Run from the repository root: python benchmarks/bench_figures.py [suppliers] [workers]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzer import AdvancedSupplyChainAnalyzer  # noqa: E402
+from bench_payload import synthetic_supplier_frame  # noqa: E402
+from figure_pool import FigurePool  # noqa: E402
+
+
+def figure_jobs(frame):
+    """The same jobs the dashboard page builds, slowest first"""
+    volume = frame.groupby('Category')['Total_Volume_USD'].sum().reset_index()
+    risk = frame[['Supplier_Name', 'Overall_Performance_Score', 'Supply_Risk_Score',
+                  'Total_Volume_USD', 'Segment']].copy()
+    risk['Bubble_Size'] = (risk['Total_Volume_USD'] / 100000).clip(10, 60)
+    return {
+        'overview': ('create_modern_dashboard', (frame,), {}),
+        'volume': ('create_volume_chart', (volume,), {}),
+        'risk': ('create_risk_matrix', (risk,), {'color_by': 'Segment'})
+    }
+
+
+def best_of(build, repeats=3):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(n_suppliers=1000, n_workers=2):
+    analyzer = AdvancedSupplyChainAnalyzer()
+    jobs = figure_jobs(synthetic_supplier_frame(n_suppliers))
+
+    sequential = FigurePool(max_workers=0)
+    pool = FigurePool(max_workers=n_workers)
+    while not pool.ready:
+        time.sleep(0.1)
+
+    try:
+        inline_time = best_of(lambda: sequential.build(analyzer, jobs))
+        pooled_time = best_of(lambda: pool.build(analyzer, jobs))
+    finally:
+        pool.shutdown()
+
+    print(f"suppliers: {n_suppliers:,}  figures: {len(jobs)}  workers: {n_workers}  cores: {os.cpu_count()}")
+    print(f"sequential: {inline_time * 1000:.0f} ms")
+    print(f"pooled:     {pooled_time * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
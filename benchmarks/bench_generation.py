@@ -0,0 +1,35 @@
+"""Time block-parallel synthetic generation and check it is identical for every worker count.
+
+Run from the repository root: python benchmarks/bench_generation.py [suppliers] [months] [max_workers]
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generation import generate_monthly_data, synthetic_suppliers  # noqa: E402
+
+
+def main(n_suppliers=20_000, n_months=24, max_workers=4):
+    suppliers = synthetic_suppliers(n_suppliers)
+    # One fixed clock so runs differ only in the worker count
+    now = datetime(2025, 1, 1)
+
+    reference = None
+    for workers in sorted({1, 2, max_workers}):
+        start = time.perf_counter()
+        monthly = generate_monthly_data(suppliers, n_months=n_months, workers=workers, now=now)
+        elapsed = time.perf_counter() - start
+        cells = monthly.shape[0] * monthly.shape[1]
+        if reference is None:
+            reference = monthly
+        identical = monthly.equals(reference)
+        print(f"workers: {workers}  rows: {len(monthly):,}  cells: {cells:,}  "
+              f"{elapsed * 1000:.0f} ms ({cells / elapsed / 1e6:.1f}M cells/s)  identical: {identical}")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:4]]
+    main(*args)
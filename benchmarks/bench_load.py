@@ -0,0 +1,224 @@
+"""Drive N concurrent headless dashboard sessions and report rerun latency, memory and CPU.
+
+Each session is a Streamlit AppTest with its own session state (and so its own
+analyzer), stepping through a scripted, seeded mix of interactions: switching
+dashboards, moving the month range, searching and paging the table, and working in
+the analysis tab. Sessions run on threads in this process, which is how the
+Streamlit server runs them too, so CPU contention and the GIL are included.
+
+Run from the repository root: python benchmarks/bench_load.py [--sessions 50] [--steps 10]
+"""
+import argparse
+import contextlib
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from collections import defaultdict
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEARCH_TERMS = ['Tech', 'Global', 'Ltd', 'Materials', 'SUP01', 'Parts', 'Logistics', 'Inc']
+
+# Interaction -> relative frequency in a scripted sequence
+INTERACTION_WEIGHTS = {
+    'period': 3,
+    'dashboard': 2,
+    'search': 3,
+    'page': 1,
+    'sort': 1,
+    'rule': 1,
+    'alerts': 1
+}
+
+
+def _rss_bytes() -> int:
+    """Current resident set size of this process"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        # No procfs: fall back to the peak, which only overstates
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def allow_concurrent_app_tests():
+    """Let AppTest sessions overlap.
+
+    Every AppTest run installs a mock Runtime singleton and patches the
+    config getter, then undoes both when it finishes, which would pull them
+    out from under sessions still running. It also compiles the page into a
+    fresh script cache, and concurrent compiles can fail on Python 3.11.
+    Install all three once for the whole load test instead; the real server
+    likewise has one runtime and one script cache for all sessions.
+    """
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.testing.v1 import app_test, local_script_runner
+    from streamlit.testing.v1.util import build_mock_config_get_option
+
+    config.get_option = build_mock_config_get_option({'global.appTest': True})
+    app_test.patch_config_options = lambda overrides: contextlib.nullcontext()
+    script_cache = app_test.ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+
+    latest = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            latest['runtime'] = cls._instance
+        if 'runtime' not in latest:
+            raise RuntimeError("Runtime hasn't been created!")
+        return latest['runtime']
+
+    def exists(cls):
+        return cls._instance is not None or 'runtime' in latest
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(exists)
+
+
+def interact(app, action: str, rng: random.Random):
+    """Apply one scripted widget change to a session; the caller reruns it"""
+    if action == 'period':
+        period = app.select_slider(key='month_range')
+        start, end = sorted(rng.sample(range(len(period.options)), 2))
+        period.set_range(period.options[start], period.options[end])
+    elif action == 'dashboard':
+        dashboards = app.sidebar.radio[0]
+        dashboards.set_value(rng.choice(dashboards.options))
+    elif action == 'search':
+        app.text_input(key='table_search').input(rng.choice(SEARCH_TERMS + ['']))
+    elif action == 'page':
+        page = app.number_input(key='table_page')
+        page.set_value(rng.randint(int(page.min), int(page.max)))
+    elif action == 'sort':
+        sort_by = app.selectbox(key='table_sort_by')
+        sort_by.select(rng.choice(sort_by.options))
+    elif action == 'rule':
+        rules = app.selectbox(key='alert_rule_selected')
+        rules.select(rng.choice(rules.options))
+    elif action == 'alerts':
+        lookback = app.selectbox(key='alerts_lookback')
+        lookback.select(rng.choice(lookback.options))
+
+
+def run_session(app, index: int, steps: int, think_time: float, seed: int, results: dict, start_barrier):
+    """One user: open the page, then a seeded sequence of interactions, each followed by a rerun"""
+    rng = random.Random(seed * 100_003 + index)
+    actions, weights = zip(*INTERACTION_WEIGHTS.items())
+    start_barrier.wait()
+
+    plan = ['open'] + rng.choices(actions, weights, k=steps)
+    for action in plan:
+        if action != 'open':
+            time.sleep(rng.uniform(0, 2 * think_time))
+            try:
+                interact(app, action, rng)
+            except (KeyError, IndexError):
+                # The widget is not on the page this session is showing
+                results['skipped'][action] += 1
+                continue
+        started = time.perf_counter()
+        app.run()
+        elapsed = time.perf_counter() - started
+        with results['lock']:
+            results['latency'][action].append(elapsed)
+            results['errors'] += len(app.exception)
+
+
+def percentiles(values) -> dict:
+    if not values:
+        return {'count': 0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99]) * 1000
+    return {'count': len(values), 'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99, 'max_ms': max(values) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=50)
+    parser.add_argument('--steps', type=int, default=10, help='interactions per session after the first load')
+    parser.add_argument('--think-time', type=float, default=0.5, help='mean seconds between interactions')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help='also write the report to this file')
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from streamlit.testing.v1 import AppTest
+    allow_concurrent_app_tests()
+    # Creating sessions outside a script run is expected here
+    logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').setLevel(logging.ERROR)
+
+    # One untimed session compiles the page and performs every lazy import before the
+    # sessions start, as on a warm server; it also keeps shared modules out of the memory baseline
+    warmup = AppTest.from_file(os.path.join(ROOT, 'app_new.py'), default_timeout=300).run()
+    if warmup.exception:
+        raise RuntimeError(f"Warm-up run failed: {warmup.exception[0].value}")
+    del warmup
+
+    results = {'lock': threading.Lock(), 'latency': defaultdict(list), 'errors': 0, 'skipped': defaultdict(int)}
+    apps = [AppTest.from_file(os.path.join(ROOT, 'app_new.py'), default_timeout=300) for _ in range(args.sessions)]
+    barrier = threading.Barrier(args.sessions)
+    threads = [threading.Thread(target=run_session,
+                                args=(app, i, args.steps, args.think_time, args.seed, results, barrier))
+               for i, app in enumerate(apps)]
+
+    rss_before, cpu_before, wall_start = _rss_bytes(), _cpu_seconds(), time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+    cpu = _cpu_seconds() - cpu_before
+    # Sessions are still referenced, so the growth is their retained state plus caches
+    rss_after = _rss_bytes()
+
+    all_latencies = [value for values in results['latency'].values() for value in values]
+    report = {
+        'sessions': args.sessions,
+        'steps_per_session': args.steps,
+        'wall_seconds': wall,
+        'reruns': len(all_latencies),
+        'errors': results['errors'],
+        'skipped_interactions': dict(results['skipped']),
+        'latency': percentiles(all_latencies),
+        'latency_by_action': {action: percentiles(values) for action, values in sorted(results['latency'].items())},
+        'memory_per_session_mb': (rss_after - rss_before) / args.sessions / 2**20,
+        'rss_mb': rss_after / 2**20,
+        'cpu_seconds': cpu,
+        'cpu_utilization': cpu / wall,
+        'cpu_cores': os.cpu_count()
+    }
+
+    overall = report['latency']
+    print(f"sessions: {args.sessions}  reruns: {report['reruns']}  errors: {report['errors']}  wall: {wall:.1f} s")
+    print(f"rerun latency: p50 {overall['p50_ms']:.0f} ms  p95 {overall['p95_ms']:.0f} ms  "
+          f"p99 {overall['p99_ms']:.0f} ms  max {overall['max_ms']:.0f} ms")
+    for action, stats in report['latency_by_action'].items():
+        print(f"  {action:<10} n={stats['count']:<5} p50 {stats['p50_ms']:7.0f} ms  "
+              f"p95 {stats['p95_ms']:7.0f} ms  p99 {stats['p99_ms']:7.0f} ms")
+    print(f"memory: {report['memory_per_session_mb']:.1f} MB per session, {report['rss_mb']:.0f} MB resident")
+    print(f"server cpu: {cpu:.1f} s, {report['cpu_utilization'] * 100:.0f}% of one core "
+          f"({report['cpu_cores']} cores available)")
+    if report['skipped_interactions']:
+        print(f"skipped interactions (widget not on page): {report['skipped_interactions']}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 1 if report['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Report chart payload bytes before and after compaction, after checking that
+compaction keeps large hover values exact.
+
+Run from the repository root: python benchmarks/bench_payload.py [suppliers]
+"""
+import base64
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzer import AdvancedSupplyChainAnalyzer  # noqa: E402
+
+
+def synthetic_supplier_frame(n_suppliers, seed=42):
+    """Supplier-level frame with every column the chart builders read"""
+    rng = np.random.default_rng(seed)
+    categories = np.array([f'Category {i}' for i in range(40)])
+    frame = pd.DataFrame({
+        'Supplier_Name': np.char.add('Supplier ', np.arange(n_suppliers).astype(str)),
+        'Category': categories[rng.integers(0, len(categories), n_suppliers)],
+        'Total_Volume_USD': rng.lognormal(15, 0.6, n_suppliers),
+        'Overall_Performance_Score': rng.uniform(60, 100, n_suppliers),
+        'Supply_Risk_Score': rng.uniform(0, 100, n_suppliers),
+        'Segment': np.char.add('Segment ', rng.integers(1, 5, n_suppliers).astype(str))
+    })
+    for column in ['Strategic_Value_Score', 'Avg_Unit_Cost', 'Cost_Competitiveness_Score',
+                   'Quality_Excellence_Score', 'Avg_Quality_Score', 'Avg_Defect_Rate_PPM',
+                   'Avg_Delivery_Rate', 'Delivery_Consistency', 'OTIF_Rate', 'Avg_Lead_Time']:
+        frame[column] = rng.uniform(1, 100, n_suppliers)
+    for column in ['Innovation_Score', 'Sustainability_Score', 'Financial_Stability_Score']:
+        frame[column] = rng.uniform(1, 10, n_suppliers)
+    frame['Quality_Trend'] = rng.integers(-1, 2, n_suppliers)
+    return frame
+
+
+def decode(value) -> np.ndarray:
+    """Values of a compacted per-point array, plain list or plotly.js typed array"""
+    if isinstance(value, dict):
+        return np.frombuffer(base64.b64decode(value['bdata']), dtype=np.dtype(value['dtype']).newbyteorder('<'))
+    return np.asarray(value)
+
+
+def check_large_values(analyzer, n_suppliers):
+    """Volumes in the tens of millions must reach the browser as whole dollars, not float32 approximations"""
+    data = synthetic_supplier_frame(n_suppliers)
+    data['Total_Volume_USD'] = np.random.default_rng(1).uniform(2e7, 9e7, n_suppliers) + 0.37
+    for color_by, field in [('Segment', 'customdata'), (None, 'marker.color')]:
+        figure = analyzer.create_risk_matrix(data, color_by=color_by)
+        for trace in figure.to_dict()['data']:
+            sent = decode(trace['customdata'] if field == 'customdata' else trace['marker']['color'])
+            expected = np.round(data.loc[data['Supplier_Name'].isin(trace['text']), 'Total_Volume_USD'].to_numpy(), 2)
+            assert np.array_equal(sent, expected), f"{field} values changed by compaction"
+    print("large hover values round-trip exactly: OK")
+
+
+def main(n_suppliers=5000):
+    analyzer = AdvancedSupplyChainAnalyzer()
+    data = synthetic_supplier_frame(n_suppliers)
+    volume_data = data.groupby('Category')['Total_Volume_USD'].sum().reset_index()
+
+    figures = {
+        'supplier dashboard': lambda: analyzer.create_supplier_dashboard(data),
+        'modern dashboard': lambda: analyzer.create_modern_dashboard(data),
+        'risk matrix': lambda: analyzer.create_risk_matrix(data),
+        'risk matrix by segment': lambda: analyzer.create_risk_matrix(data, color_by='Segment'),
+        'volume chart': lambda: analyzer.create_volume_chart(volume_data)
+    }
+
+    check_large_values(analyzer, n_suppliers)
+    print(f"suppliers: {n_suppliers:,}")
+    print(f"{'figure':<24}{'before (KB)':>13}{'after (KB)':>12}{'ratio':>8}{'serialize (ms)':>16}")
+    for name, build in figures.items():
+        fig = build()
+        report = fig.payload_report()
+        start = time.perf_counter()
+        fig.to_dict()
+        serialize_ms = (time.perf_counter() - start) * 1000
+        print(f"{name:<24}{report['before'] / 1024:>13.1f}{report['after'] / 1024:>12.1f}"
+              f"{report['after'] / report['before']:>8.2f}{serialize_ms:>16.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
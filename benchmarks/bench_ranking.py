@@ -0,0 +1,64 @@
+"""Benchmark top-N partial selection against full sorts at 1M rows.
+
+Run from the repository root: python benchmarks/bench_ranking.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ranking import top_n, top_label  # noqa: E402
+
+
+def _time(func, repeat=5):
+    """Best wall time of several runs, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(n_rows=1_000_000):
+    rng = np.random.default_rng(42)
+    data = pd.DataFrame({
+        'Supplier_Name': np.char.add('Supplier ', np.arange(n_rows).astype(str)),
+        'Total_Volume_USD': rng.lognormal(14, 1, n_rows),
+        'Overall_Performance_Score': rng.uniform(50, 100, n_rows),
+        'Supply_Risk_Score': rng.uniform(0, 100, n_rows)
+    })
+
+    cases = [
+        ('top 8 by volume',
+         lambda: data.sort_values('Total_Volume_USD', ascending=True).tail(8),
+         lambda: top_n(data, 'Total_Volume_USD', 8, ascending=True)),
+        ('top 15 by volume',
+         lambda: data.sort_values('Total_Volume_USD', ascending=True).tail(15),
+         lambda: top_n(data, 'Total_Volume_USD', 15, ascending=True)),
+        ('top 10 + Others rollup',
+         lambda: pd.concat([
+             data.sort_values('Total_Volume_USD').iloc[:-10][['Total_Volume_USD']].sum().to_frame('Others').T,
+             data.sort_values('Total_Volume_USD').iloc[-10:]
+         ]),
+         lambda: top_n(data, 'Total_Volume_USD', 10, ascending=True,
+                       others_label='Others', label_column='Supplier_Name')),
+        ('top performer',
+         lambda: data.loc[data['Overall_Performance_Score'].idxmax(), 'Supplier_Name'],
+         lambda: top_label(data, 'Overall_Performance_Score', 'Supplier_Name')),
+    ]
+
+    print(f"rows: {n_rows:,}")
+    print(f"{'case':<26}{'full sort (ms)':>16}{'top_n (ms)':>14}{'speedup':>10}")
+    for name, baseline, ranked in cases:
+        base_ms = _time(baseline)
+        ranked_ms = _time(ranked)
+        print(f"{name:<26}{base_ms:>16.1f}{ranked_ms:>14.1f}{base_ms / ranked_ms:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,54 @@
+"""Benchmark re-weighting the performance score: one slider move, then the top of the ranking.
+
+Run from the repository root: python benchmarks/bench_scoring.py [suppliers] [moves]
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube import MetricCube  # noqa: E402
+from timeline import CumulativeCube  # noqa: E402
+from scoring import SCORE_COMPONENTS, PerformanceScorer  # noqa: E402
+from generation import generate_monthly_data, synthetic_suppliers  # noqa: E402
+
+
+def main(n_suppliers=100_000, moves=200, rows=50):
+    monthly = generate_monthly_data(synthetic_suppliers(n_suppliers), n_months=24, now=datetime(2025, 1, 15))
+    metrics = [metric for metric, _ in SCORE_COMPONENTS.values()]
+    means = CumulativeCube(MetricCube.from_frame(monthly, metrics)).aggregate(metrics=metrics)
+
+    start = time.perf_counter()
+    scorer = PerformanceScorer.from_means(means)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # Seeded slider moves: one component's weight at a time, as the sliders do
+    rng = np.random.default_rng(0)
+    timings, full_sort = [], []
+    for _ in range(moves):
+        component = scorer.components[rng.integers(len(scorer.components))]
+        start = time.perf_counter()
+        scorer.set_weights({component: float(rng.integers(0, 21)) / 2})
+        top = scorer.top(rows)
+        timings.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        expected = np.argsort(-(scorer.matrix @ np.array(list(scorer.weights.values()))), kind='stable')[:rows]
+        full_sort.append(time.perf_counter() - start)
+        assert np.allclose(top['Weighted_Score'].to_numpy(), scorer.scores[expected])
+
+    p50, p99 = np.percentile(timings, [50, 99]) * 1000
+    print(f"suppliers: {n_suppliers:,}  components: {len(scorer.components)}  "
+          f"matrix build {build_ms:.0f} ms (once per dataset)")
+    print(f"  slider move + top {rows}: p50 {p50:.2f} ms  p99 {p99:.2f} ms")
+    print(f"  recompute + full sort:    p50 {np.percentile(full_sort, 50) * 1000:.2f} ms")
+    print("OK")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
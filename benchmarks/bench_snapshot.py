@@ -0,0 +1,52 @@
+"""Benchmark analyzer snapshots: cold compute versus memory-mapped reload.
+
+Run from the repository root: python benchmarks/bench_snapshot.py [rows] [suppliers]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzer import AdvancedSupplyChainAnalyzer  # noqa: E402
+from bench_cost_analysis import synthetic_monthly  # noqa: E402
+
+
+def main(n_rows=5_000_000, n_suppliers=50_000):
+    suppliers, monthly, performance = synthetic_monthly(n_rows, n_suppliers)
+
+    start = time.perf_counter()
+    analyzer = AdvancedSupplyChainAnalyzer()
+    analyzer._graph.set('suppliers_data', suppliers)
+    analyzer._graph.set('monthly_data', monthly)
+    analyzer._graph.restore('performance_data', performance)
+    analyzer._graph.restore('segments', performance[['Supplier_ID']].assign(Segment='Segment 1'))
+    analyzer._graph.restore('supply_chain_data', performance)
+    analyzer.cost_analysis
+    compute_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'snapshot')
+        start = time.perf_counter()
+        analyzer.save_snapshot(path)
+        save_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        restored = AdvancedSupplyChainAnalyzer()
+        restored.load_snapshot(path)
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        restored.monthly_data['Total_Cost_USD'].sum()
+        scan_time = time.perf_counter() - start
+
+    print(f"rows: {n_rows:,}  suppliers: {n_suppliers:,}")
+    print(f"cost analysis compute: {compute_time * 1000:.0f} ms")
+    print(f"save snapshot: {save_time * 1000:.0f} ms")
+    print(f"load snapshot: {load_time * 1000:.1f} ms  (first column scan {scan_time * 1000:.1f} ms)")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,79 @@
+"""Cold-start benchmark: analyzer import time and app first paint.
+
+Run from the repository root: python benchmarks/bench_startup.py
+Exits non-zero when a budget is exceeded or a heavy module is imported eagerly,
+so it can guard against startup regressions.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only load when a chart, export or palette is first built
+DEFERRED_MODULES = ['plotly.graph_objects', 'plotly.subplots', 'openpyxl', 'colour', 'kaleido']
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import analyzer
+elapsed = time.perf_counter() - start
+print(json.dumps({'seconds': elapsed, 'loaded': [m for m in %r if m in sys.modules]}))
+""" % (DEFERRED_MODULES,)
+
+
+def measure_import(repeat=5):
+    """Best import time of analyzer in fresh interpreters, plus eagerly loaded heavy modules"""
+    best, loaded = float('inf'), []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', IMPORT_PROBE], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        best = min(best, result['seconds'])
+        loaded = result['loaded']
+    return best * 1000, loaded
+
+
+def measure_first_paint():
+    """Script-relative first paint and data-ready times from a cold app session"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.join(ROOT, 'app_new.py'), default_timeout=120).run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].value)
+    timings = app.session_state['render_timings']
+    return timings['first_paint'] * 1000, timings['data_ready'] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--max-import-ms', type=float, default=1500)
+    parser.add_argument('--max-first-paint-ms', type=float, default=250)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    import_ms, eager = measure_import()
+    first_paint_ms, data_ready_ms = measure_first_paint()
+
+    print(f"analyzer import:  {import_ms:8.1f} ms (budget {args.max_import_ms:.0f} ms)")
+    print(f"first paint:      {first_paint_ms:8.1f} ms (budget {args.max_first_paint_ms:.0f} ms)")
+    print(f"data ready:       {data_ready_ms:8.1f} ms")
+    print(f"eager heavy imports: {', '.join(eager) or 'none'}")
+
+    failures = []
+    if import_ms > args.max_import_ms:
+        failures.append('import time over budget')
+    if first_paint_ms > args.max_first_paint_ms:
+        failures.append('first paint over budget')
+    if eager:
+        failures.append('heavy modules imported at load time')
+    if failures:
+        print('FAIL: ' + '; '.join(failures))
+        sys.exit(1)
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
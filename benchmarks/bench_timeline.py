@@ -0,0 +1,58 @@
+"""Benchmark month-range filtering: boolean scan and group-by against sorted slices and running totals.
+
+Run from the repository root: python benchmarks/bench_timeline.py [suppliers] [months]
+"""
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cube import MetricCube  # noqa: E402
+from timeline import CumulativeCube, MonthPartitions  # noqa: E402
+from generation import generate_monthly_data, synthetic_suppliers  # noqa: E402
+from bench_cube import best_of  # noqa: E402
+
+
+def main(n_suppliers=100_000, n_months=24):
+    # One record per supplier and month, as the monthly schema requires
+    monthly = generate_monthly_data(synthetic_suppliers(n_suppliers), n_months=n_months, now=datetime(2025, 1, 15))
+    n_rows = len(monthly)
+    metrics = ['Total_Cost_USD', 'Quality_Score', 'On_Time_Delivery_Rate']
+
+    start = time.perf_counter()
+    partitions = MonthPartitions(monthly)
+    cumulative = CumulativeCube(MetricCube.from_frame(monthly, metrics))
+    build_ms = (time.perf_counter() - start) * 1000
+
+    months = partitions.months
+    final = len(months) - 1
+    ranges = [(months[0], months[final]), (months[max(0, final - 11)], months[final]),
+              (months[final // 4], months[final // 3]), (months[final], months[final])]
+
+    def scan(first, last):
+        selected = monthly[monthly['Month'].between(first, last)].copy()
+        return selected.groupby('Supplier_ID', observed=True)[metrics].mean()
+
+    def indexed(first, last):
+        partitions.rows(first, last)
+        return cumulative.aggregate(first, last, how='mean', metrics=metrics)
+
+    # Same answers up to float32 cube rounding
+    expected, result = scan(*ranges[2]), indexed(*ranges[2])
+    worst = np.nanmax(np.abs(result.loc[expected.index].to_numpy() - expected.to_numpy()) / np.abs(expected.to_numpy()))
+
+    print(f"rows: {n_rows:,}  suppliers: {n_suppliers:,}  months: {len(months)}  "
+          f"index build {build_ms:.0f} ms (once per dataset)")
+    for first, last in ranges:
+        print(f"  {first}..{last}: scan + group-by {best_of(lambda: scan(first, last)):7.1f} ms   "
+              f"slice + running totals {best_of(lambda: indexed(first, last)):6.1f} ms")
+    print(f"max relative difference: {worst:.2e}")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
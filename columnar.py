@@ -0,0 +1,98 @@
+from typing import Optional, Union
+
+import pandas as pd
+
+# pyarrow is imported inside the functions that use it, like the other heavy dependencies
+
+# Format -> (file extension, MIME type)
+COLUMNAR_FORMATS = {
+    'arrow': ('arrows', 'application/vnd.apache.arrow.stream'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet')
+}
+
+# Codecs each format accepts; the first is the default. Arrow IPC buffers support only LZ4 and ZSTD
+COMPRESSIONS = {
+    'arrow': ('none', 'lz4', 'zstd'),
+    'parquet': ('zstd', 'snappy', 'gzip', 'brotli', 'lz4', 'none')
+}
+
+# Rows per Arrow record batch; bounds the size of each message in the stream
+IPC_BATCH_ROWS = 64 * 1024
+
+
+def to_arrow_table(frame: pd.DataFrame):
+    """Arrow table built column by column from the frame, without the index.
+
+    Numeric and datetime columns are handed over as their buffers; only
+    object (string) columns are encoded.
+    """
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(frame, preserve_index=False)
+
+
+def _check_compression(fmt: str, compression: Optional[str]) -> Optional[str]:
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}'; use one of {', '.join(COLUMNAR_FORMATS)}")
+    compression = compression or 'none'
+    if compression not in COMPRESSIONS[fmt]:
+        raise ValueError(f"Unsupported {fmt} compression '{compression}'; use one of {', '.join(COMPRESSIONS[fmt])}")
+    return None if compression == 'none' else compression
+
+
+def write_arrow_ipc(frame: pd.DataFrame, destination: Optional[str] = None,
+                    compression: Optional[str] = None) -> Optional[bytes]:
+    """Write the frame as an Arrow IPC stream to a file, or return the bytes"""
+    import pyarrow as pa
+
+    options = pa.ipc.IpcWriteOptions(compression=_check_compression('arrow', compression))
+    table = to_arrow_table(frame)
+    sink = pa.BufferOutputStream() if destination is None else pa.OSFile(destination, 'wb')
+    try:
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table, max_chunksize=IPC_BATCH_ROWS)
+        if destination is None:
+            return sink.getvalue().to_pybytes()
+    finally:
+        if destination is not None:
+            sink.close()
+    return None
+
+
+def write_parquet(frame: pd.DataFrame, destination: Optional[str] = None, compression: Optional[str] = 'zstd',
+                  compression_level: Optional[int] = None) -> Optional[bytes]:
+    """Write the frame as Parquet to a file, or return the bytes"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    codec = _check_compression('parquet', compression)
+    table = to_arrow_table(frame)
+    sink = pa.BufferOutputStream() if destination is None else destination
+    pq.write_table(table, sink, compression=codec or 'none', compression_level=compression_level)
+    return sink.getvalue().to_pybytes() if destination is None else None
+
+
+def export_frame(frame: pd.DataFrame, fmt: str = 'parquet', compression: Optional[str] = None,
+                 destination: Optional[str] = None) -> Optional[bytes]:
+    """Write the frame in a columnar format; ``compression`` defaults to the format's first codec"""
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}'; use one of {', '.join(COLUMNAR_FORMATS)}")
+    compression = compression or COMPRESSIONS[fmt][0]
+    if fmt == 'arrow':
+        return write_arrow_ipc(frame, destination, compression)
+    return write_parquet(frame, destination, compression)
+
+
+def read_frame(source: Union[bytes, str], fmt: str = 'parquet') -> pd.DataFrame:
+    """Inverse of export_frame, from bytes or a file path"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}'; use one of {', '.join(COLUMNAR_FORMATS)}")
+    if isinstance(source, bytes):
+        source = pa.BufferReader(source)
+    if fmt == 'parquet':
+        return pq.read_table(source).to_pandas()
+    with pa.ipc.open_stream(source) as reader:
+        return reader.read_all().to_pandas()
@@ -0,0 +1,161 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence
+
+# Axis of each dimension in MetricCube.values
+SUPPLIER_AXIS, MONTH_AXIS, METRIC_AXIS = 0, 1, 2
+
+# Plain reductions used when a slice has no gaps; the nan* variants copy the whole cube
+_DENSE_REDUCERS = {
+    'mean': np.mean,
+    'sum': np.sum,
+    'min': np.min,
+    'max': np.max,
+    'std': np.std,
+    'median': np.median
+}
+
+_REDUCERS = {
+    'mean': np.nanmean,
+    'sum': np.nansum,
+    'min': np.nanmin,
+    'max': np.nanmax,
+    'std': np.nanstd,
+    'median': np.nanmedian
+}
+
+
+class MetricCube:
+    """Dense supplier x month x metric array of monthly records.
+
+    ``values`` is float32 with NaN where a supplier reported nothing for a
+    month. Label lookups go through the supplier and month index maps; the
+    per-supplier, per-month and per-metric accessors return views into
+    ``values`` rather than copies, so they are free and must not be modified.
+    """
+
+    def __init__(self, values: np.ndarray, supplier_ids: Sequence, months: Sequence, metrics: Sequence[str]):
+        self.values = values
+        self.supplier_ids = pd.Index(supplier_ids, name='Supplier_ID')
+        self.months = pd.Index(months, name='Month')
+        self.metrics = pd.Index(metrics, name='Metric')
+        self.supplier_index: Dict = {supplier: i for i, supplier in enumerate(self.supplier_ids)}
+        self.month_index: Dict = {month: i for i, month in enumerate(self.months)}
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        metrics: Optional[List[str]] = None,
+        supplier_column: str = 'Supplier_ID',
+        month_column: str = 'Month',
+        path: Optional[str] = None
+    ) -> 'MetricCube':
+        """Pivot long-format monthly records into a cube.
+
+        Metrics default to every numeric column. Duplicate (supplier, month)
+        rows are averaged. With ``path`` the cube is backed by a memory-mapped
+        .npy file instead of process memory.
+        """
+        if metrics is None:
+            metrics = [column for column in frame.columns
+                       if column not in (supplier_column, month_column)
+                       and pd.api.types.is_numeric_dtype(frame[column])]
+
+        supplier_codes, supplier_ids = pd.factorize(frame[supplier_column], sort=True)
+        month_codes, months = pd.factorize(frame[month_column], sort=True)
+        n_suppliers, n_months = len(supplier_ids), len(months)
+        cells = supplier_codes.astype(np.int64) * n_months + month_codes
+
+        shape = (n_suppliers, n_months, len(metrics))
+        if path is None:
+            values = np.empty(shape, dtype=np.float32)
+        else:
+            values = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=shape)
+
+        # Cells are filled one metric at a time with bincount, which also averages duplicates
+        rows_per_cell = np.bincount(cells, minlength=n_suppliers * n_months)
+        for k, metric in enumerate(metrics):
+            column = frame[metric].to_numpy(dtype=np.float64, na_value=np.nan)
+            missing = np.isnan(column)
+            if missing.any():
+                counts = np.bincount(cells, weights=~missing, minlength=n_suppliers * n_months)
+                column = np.where(missing, 0.0, column)
+            else:
+                counts = rows_per_cell
+            totals = np.bincount(cells, weights=column, minlength=n_suppliers * n_months)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                values[:, :, k] = (totals / counts).reshape(n_suppliers, n_months)
+
+        if path is not None:
+            values.flush()
+        return cls(values, supplier_ids, months, metrics)
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def _metric_position(self, metric: str) -> int:
+        return self.metrics.get_loc(metric)
+
+    def supplier_series(self, supplier_id, metric: Optional[str] = None) -> np.ndarray:
+        """Month x metric view for one supplier, or one metric's monthly series"""
+        row = self.values[self.supplier_index[supplier_id]]
+        return row if metric is None else row[:, self._metric_position(metric)]
+
+    def cross_section(self, month, metric: Optional[str] = None) -> np.ndarray:
+        """Supplier x metric view for one month, or one metric across suppliers"""
+        section = self.values[:, self.month_index[month]]
+        return section if metric is None else section[:, self._metric_position(metric)]
+
+    def metric_matrix(self, metric: str) -> np.ndarray:
+        """Supplier x month view of one metric"""
+        return self.values[:, :, self._metric_position(metric)]
+
+    def month_range(self, start=None, end=None) -> 'MetricCube':
+        """Cube restricted to months in [start, end]; the values are a view"""
+        lo = 0 if start is None else self.months.searchsorted(start, side='left')
+        hi = len(self.months) if end is None else self.months.searchsorted(end, side='right')
+        return MetricCube(self.values[:, lo:hi], self.supplier_ids, self.months[lo:hi], self.metrics)
+
+    def reduce(
+        self,
+        how: str = 'mean',
+        over: str = 'month',
+        metrics: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """NaN-skipping reduction along the month or supplier axis.
+
+        Reducing over months gives one row per supplier, over suppliers one row
+        per month; columns are metrics. Empty slices come back as NaN.
+        """
+        axis = {'month': MONTH_AXIS, 'supplier': SUPPLIER_AXIS}[over]
+        values = self.values
+        labels = self.metrics
+        if metrics is not None:
+            positions = self.metrics.get_indexer(metrics)
+            if (positions < 0).any():
+                missing = [metric for metric, position in zip(metrics, positions) if position < 0]
+                raise KeyError(f"Metrics not in the cube: {', '.join(missing)}")
+            values, labels = values[:, :, positions], self.metrics[positions]
+
+        # All-NaN slices already come back as NaN, so numpy's warning about them is noise
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            reducer = _REDUCERS[how] if np.isnan(values).any() else _DENSE_REDUCERS[how]
+            # Sums and moments accumulate in double precision; the cells themselves stay float32
+            if how in ('mean', 'sum', 'std'):
+                reduced = reducer(values, axis=axis, dtype=np.float64)
+            else:
+                reduced = reducer(values, axis=axis)
+        index = self.supplier_ids if axis == MONTH_AXIS else self.months
+        return pd.DataFrame(reduced, index=index, columns=labels)
+
+    def count(self, over: str = 'month') -> pd.DataFrame:
+        """Number of reported (non-NaN) cells per supplier or month and metric"""
+        axis = {'month': MONTH_AXIS, 'supplier': SUPPLIER_AXIS}[over]
+        index = self.supplier_ids if axis == MONTH_AXIS else self.months
+        return pd.DataFrame((~np.isnan(self.values)).sum(axis=axis), index=index, columns=self.metrics)
+
@@ -0,0 +1,133 @@
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+BASE_CURRENCY = 'USD'
+
+# Month, Currency, USD_Per_Unit. The bundled table holds approximate monthly reference rates
+# for offline use; point SUPPLY_CHAIN_FX_RATES at a maintained table in production
+DEFAULT_RATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets', 'fx_rates.csv')
+
+# Monetary columns of each table. They keep their _USD names and hold amounts in the
+# analyzer's reporting currency, which is USD unless the dashboard is rebased
+MONTHLY_MONEY_COLUMNS = ['Unit_Cost_USD', 'Total_Cost_USD']
+SUPPLIER_MONEY_COLUMNS = ['Annual_Volume_USD']
+
+COUNTRY_CURRENCIES = {
+    'USA': 'USD', 'Germany': 'EUR', 'Netherlands': 'EUR', 'Italy': 'EUR', 'France': 'EUR', 'Spain': 'EUR',
+    'Belgium': 'EUR', 'UK': 'GBP', 'Switzerland': 'CHF', 'Poland': 'PLN', 'Czech Republic': 'CZK',
+    'Turkey': 'TRY', 'China': 'CNY', 'Japan': 'JPY', 'South Korea': 'KRW', 'Taiwan': 'TWD', 'India': 'INR',
+    'Singapore': 'SGD', 'Malaysia': 'MYR', 'Thailand': 'THB', 'Vietnam': 'VND', 'Canada': 'CAD',
+    'Mexico': 'MXN', 'Brazil': 'BRL'
+}
+
+CURRENCY_SYMBOLS = {'USD': '$', 'EUR': '€', 'GBP': '£', 'JPY': '¥', 'CNY': 'CN¥', 'INR': '₹', 'KRW': '₩'}
+
+
+def currency_symbol(currency: str) -> str:
+    """Symbol shown in front of amounts; the ISO code for currencies without one"""
+    return CURRENCY_SYMBOLS.get(currency, f'{currency} ')
+
+
+def load_fx_rates(path: Optional[str] = None) -> pd.DataFrame:
+    """Monthly rates table sorted by date: the USD value of one unit of each currency"""
+    path = path or os.environ.get('SUPPLY_CHAIN_FX_RATES') or DEFAULT_RATES_PATH
+    rates = pd.read_csv(path, dtype={'Month': str, 'Currency': str, 'USD_Per_Unit': np.float64})
+    if not (rates['USD_Per_Unit'] > 0).all():
+        raise ValueError(f"FX rates in {path} must all be positive")
+    rates['Date'] = pd.to_datetime(rates['Month'], format='%Y-%m')
+    return rates.sort_values(['Date', 'Currency'], kind='stable').reset_index(drop=True)
+
+
+class CurrencyConverter:
+    """Converts monetary columns between currencies at monthly rates.
+
+    A record takes the latest rate of its currency published in or before
+    its month, found with a sorted as-of merge; months before a currency's
+    first rate take that first rate. Rates are resolved once per distinct
+    (currency, month) and cached, so converting or rebasing a large frame is
+    a small merge over the new pairs plus one vectorized multiply.
+    """
+
+    def __init__(self, rates: Optional[pd.DataFrame] = None):
+        self.rates = load_fx_rates() if rates is None else rates
+        self.currencies: List[str] = sorted(set(self.rates['Currency']) | {BASE_CURRENCY})
+        self._usd_rates: Dict[Tuple[str, str], float] = {}
+
+    @property
+    def latest_month(self) -> str:
+        """Last month with a published rate; later months reuse each currency's latest rate"""
+        return self.rates['Month'].iloc[-1]
+
+    def _resolve(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], float]:
+        """USD rates of (currency, month) pairs by an as-of merge onto the rates table"""
+        wanted = pd.DataFrame(pairs, columns=['Currency', 'Month'])
+        unknown = sorted(set(wanted['Currency']) - set(self.currencies))
+        if unknown:
+            raise ValueError(f"No FX rates for currency {', '.join(map(str, unknown))}")
+        wanted['Date'] = pd.to_datetime(wanted['Month'], format='%Y-%m')
+        table = self.rates[['Date', 'Currency', 'USD_Per_Unit']]
+        merged = pd.merge_asof(wanted.sort_values('Date', kind='stable'), table,
+                               on='Date', by='Currency', direction='backward')
+        first_rates = table.groupby('Currency')['USD_Per_Unit'].first()
+        rates = merged['USD_Per_Unit'].fillna(merged['Currency'].map(first_rates))
+        rates[merged['Currency'] == BASE_CURRENCY] = 1.0
+        return dict(zip(zip(merged['Currency'], merged['Month']), rates))
+
+    def usd_rate_grid(self, currencies: Sequence[str], months: Sequence[str]) -> np.ndarray:
+        """USD value of one unit of each currency (rows) in each month (columns), through the cache"""
+        pairs = [(currency, month) for currency in currencies for month in months]
+        missing = [pair for pair in pairs if pair not in self._usd_rates]
+        if missing:
+            self._usd_rates.update(self._resolve(missing))
+        return np.array([self._usd_rates[pair] for pair in pairs], dtype=np.float64).reshape(len(currencies), len(months))
+
+    def factors(self, currencies, months, target: str = BASE_CURRENCY) -> np.ndarray:
+        """Per-row multipliers converting amounts in ``currencies`` to ``target`` at each row's month.
+
+        Either argument may be a single value shared by every row.
+        """
+        currency_codes, currency_values = _factorize(currencies)
+        month_codes, month_values = _factorize(months)
+        # A dense currency x month grid of rates, gathered per row
+        grid = self.usd_rate_grid(currency_values, month_values)
+        grid /= self.usd_rate_grid([target], month_values)
+        return grid[currency_codes, month_codes]
+
+    def convert(
+        self,
+        frame: pd.DataFrame,
+        columns: Sequence[str],
+        target: str = BASE_CURRENCY,
+        source: Optional[str] = None,
+        currency_column: str = 'Currency',
+        month: Optional[str] = None,
+        month_column: str = 'Month'
+    ) -> pd.DataFrame:
+        """Copy of the frame with the monetary columns converted to ``target`` in one pass.
+
+        Amounts are in ``source`` when given, otherwise in each row's
+        ``currency_column``; rates are those of ``month`` when given,
+        otherwise of each row's ``month_column``. Integer columns are rounded
+        back to their own dtype. Other columns are shared with the input
+        frame, not copied.
+        """
+        columns = [column for column in columns if column in frame.columns]
+        factor = self.factors(frame[currency_column] if source is None else source,
+                              frame[month_column] if month is None else month, target)
+        converted = frame[columns].to_numpy(dtype=np.float64) * factor[:, None]
+        result = frame.copy(deep=False)
+        for i, column in enumerate(columns):
+            dtype = frame[column].dtype
+            result[column] = np.round(converted[:, i]).astype(dtype) if dtype.kind in 'iu' else converted[:, i]
+        return result
+
+
+def _factorize(values) -> Tuple[np.ndarray, List]:
+    """Codes and distinct values; a single value gets one code that broadcasts over the rows"""
+    if isinstance(values, str):
+        return np.zeros(1, dtype=np.intp), [values]
+    codes, uniques = pd.factorize(values)
+    return codes, list(uniques)
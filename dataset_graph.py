@@ -0,0 +1,110 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+_MISSING = object()
+
+
+class DatasetGraph:
+    """Lazily computed datasets with declared dependencies.
+
+    Inputs are set directly; derived nodes are computed on first access from
+    their dependencies and cached. Setting an input drops the cached value of
+    every node downstream of it and nothing else.
+    """
+
+    def __init__(self):
+        self._funcs: Dict[str, Callable] = {}
+        self._deps: Dict[str, List[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._loaders: Dict[str, Optional[Callable[[], None]]] = {}
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self.version = 0
+        self.compute_counts: Dict[str, int] = {}
+
+    def add_input(self, name: str, loader: Optional[Callable[[], None]] = None, default: Any = _MISSING):
+        """Declare an input; ``loader`` is called to populate it on first access"""
+        self._deps[name] = []
+        self._dependents.setdefault(name, set())
+        self._loaders[name] = loader
+        if default is not _MISSING:
+            self._values[name] = default
+
+    def add_node(self, name: str, func: Callable, deps: Sequence[str] = ()):
+        """Declare a derived dataset computed as ``func(*dependency_values)``"""
+        for dep in deps:
+            if dep not in self._deps:
+                raise KeyError(f"Unknown dependency '{dep}' for node '{name}'")
+        self._funcs[name] = func
+        self._deps[name] = list(deps)
+        self._dependents.setdefault(name, set())
+        for dep in deps:
+            self._dependents[dep].add(name)
+
+    def is_input(self, name: str) -> bool:
+        """Whether a name is an input rather than a derived node"""
+        return name in self._loaders
+
+    def is_computed(self, name: str) -> bool:
+        """Whether a value is currently cached for the name"""
+        return name in self._values
+
+    def descendants(self, name: str) -> Set[str]:
+        """Every node that depends on the name, directly or transitively"""
+        seen, stack = set(), [name]
+        while stack:
+            for child in self._dependents.get(stack.pop(), ()):
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return seen
+
+    def peek(self, name: str, default: Any = None) -> Any:
+        """Cached value of a name without computing or loading it"""
+        return self._values.get(name, default)
+
+    def set(self, name: str, value: Any):
+        """Replace an input and invalidate only its descendants"""
+        if not self.is_input(name):
+            raise KeyError(f"'{name}' is not an input")
+        with self._lock:
+            self._values[name] = value
+            for child in self.descendants(name):
+                self._values.pop(child, None)
+            self.version += 1
+
+    def restore(self, name: str, value: Any):
+        """Seed the cached value of a derived node, e.g. from a snapshot, without recomputing it"""
+        if name not in self._funcs:
+            raise KeyError(f"'{name}' is not a derived node")
+        with self._lock:
+            self._values[name] = value
+
+    def invalidate(self, name: str):
+        """Drop the cached value of a derived node and its descendants"""
+        with self._lock:
+            for node in {name} | self.descendants(name):
+                if not self.is_input(node):
+                    self._values.pop(node, None)
+
+    def get(self, name: str) -> Any:
+        """Return a dataset, computing it and any stale dependencies at most once"""
+        if name in self._values:
+            return self._values[name]
+        with self._lock:
+            if name in self._values:
+                return self._values[name]
+            if self.is_input(name):
+                loader = self._loaders[name]
+                if loader is None:
+                    return None
+                loader()
+                return self._values.get(name)
+            if name not in self._funcs:
+                raise KeyError(f"Unknown dataset '{name}'")
+
+            args = [self.get(dep) for dep in self._deps[name]]
+            value = self._funcs[name](*args)
+            self._values[name] = value
+            self.compute_counts[name] = self.compute_counts.get(name, 0) + 1
+            return value
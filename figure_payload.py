@@ -0,0 +1,215 @@
+import base64
+import re
+from numbers import Number
+from typing import Dict, Optional
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Per-point attributes that only need coarse precision on screen
+COARSE_DECIMALS = {'size': 1, 'width': 1, 'opacity': 2}
+
+# Attributes that only matter when marker colors are numeric
+NUMERIC_COLOR_KEYS = ['colorscale', 'showscale', 'colorbar', 'cmin', 'cmax', 'cmid', 'reversescale', 'autocolorscale']
+
+# Per-point trace attributes a hovertemplate can reference instead of a duplicate text array
+TEXT_ALIASES = ['hovertext', 'x', 'y', 'labels', 'customdata']
+
+# Attributes customdata may be read from instead when it repeats one of them
+CUSTOMDATA_ALIASES = ['text', 'hovertext', 'x', 'y', 'labels']
+
+# String-valued attributes that may hold numbers but are never decoded from typed arrays
+PLAIN_ARRAY_KEYS = {'text', 'hovertext', 'ids', 'texttemplate'}
+
+_TEMPLATE_FIELD = re.compile(r'%\{text([:}])')
+_CUSTOMDATA_FIELD = re.compile(r'%\{customdata([:}])')
+
+
+def _numeric_array(value) -> Optional[np.ndarray]:
+    """A 1-D numeric view of a per-point array, or None for anything else"""
+    if isinstance(value, np.ndarray):
+        array = value
+    elif isinstance(value, (list, tuple)) and value and all(
+            isinstance(v, Number) and not isinstance(v, bool) for v in value):
+        array = np.asarray(value)
+    else:
+        return None
+    if array.ndim != 1 or array.dtype.kind not in 'iuf' or len(array) == 0:
+        return None
+    return array
+
+
+def _typed_array(array: np.ndarray, decimals: int = 2) -> Dict[str, str]:
+    """Encode a numeric array, already rounded to ``decimals``, in plotly.js typed-array form ({'dtype', 'bdata'})"""
+    if array.dtype.kind in 'iu' or (np.isfinite(array).all() and (array == np.round(array)).all()):
+        low, high = array.min(), array.max()
+        for code, dtype in [('u1', np.uint8), ('i1', np.int8), ('u2', np.uint16), ('i2', np.int16),
+                            ('u4', np.uint32), ('i4', np.int32)]:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return {'dtype': code, 'bdata': base64.b64encode(array.astype(dtype).tobytes()).decode('ascii')}
+    # Single precision only when every value reads back as the same rounded value;
+    # large amounts (volumes in the tens of millions) need double precision
+    single = array.astype('<f4')
+    if np.array_equal(np.round(single.astype(np.float64), decimals), array, equal_nan=True):
+        return {'dtype': 'f4', 'bdata': base64.b64encode(single.tobytes()).decode('ascii')}
+    return {'dtype': 'f8', 'bdata': base64.b64encode(array.astype('<f8').tobytes()).decode('ascii')}
+
+
+def _compact_arrays(node: dict, decimals: int, binary_threshold: int):
+    """Round numeric per-point arrays in place and binary-encode the large ones"""
+    for key, value in list(node.items()):
+        if isinstance(value, dict):
+            _compact_arrays(value, decimals, binary_threshold)
+            continue
+        array = _numeric_array(value)
+        if array is None:
+            continue
+        if key in COARSE_DECIMALS and len(array) > 1 and (array == array[0]).all():
+            # A uniform per-point style array is the same as a scalar
+            node[key] = array[0].item()
+            continue
+        places = COARSE_DECIMALS.get(key, decimals)
+        if array.dtype.kind == 'f':
+            array = np.round(array, places)
+        if len(array) >= binary_threshold and key not in PLAIN_ARRAY_KEYS:
+            node[key] = _typed_array(array, places)
+        else:
+            node[key] = array.tolist()
+
+
+def _point_columns(trace: dict, names) -> Dict[str, list]:
+    """Per-point arrays of a trace by the field a template reads them with; 2-D customdata gives one per column"""
+    columns = {}
+    for name in names:
+        value = trace.get(name)
+        if value is None or isinstance(value, (str, dict)):
+            continue
+        array = np.asarray(value, dtype=object)
+        if array.ndim == 1:
+            columns[name] = array.tolist()
+        elif array.ndim == 2 and name == 'customdata':
+            for i in range(array.shape[1]):
+                columns[f'customdata[{i}]'] = array[:, i].tolist()
+    return columns
+
+
+def _collapse_uniform_text(trace: dict):
+    """A label repeated on every point is sent once: plotly applies a scalar text to all points"""
+    for key in ('text', 'hovertext'):
+        value = trace.get(key)
+        if value is None or isinstance(value, (str, dict)) or len(value) < 2:
+            continue
+        first = value[0]
+        if isinstance(first, str) and all(item == first for item in value):
+            trace[key] = first
+
+
+def _dedupe_text(trace: dict):
+    """Drop text arrays that are never drawn or that duplicate another per-point array"""
+    _collapse_uniform_text(trace)
+    text = trace.get('text')
+    if text is None or isinstance(text, str):
+        return
+    template = trace.get('hovertemplate') or ''
+    mode = trace.get('mode')
+    # Scatter text only renders when the mode asks for it; other trace types always draw it
+    drawn = mode is not None and 'text' in mode
+    if trace.get('type', 'scatter') not in ('scatter', 'scattergl'):
+        drawn = True
+
+    if not drawn and not _TEMPLATE_FIELD.search(template) and 'text' not in str(trace.get('hoverinfo', '')):
+        del trace['text']
+        return
+    if drawn:
+        return
+
+    # Hover-only labels that equal another per-point array (including a customdata
+    # column) are read from that array instead
+    text_list = list(text)
+    for alias, values in _point_columns(trace, TEXT_ALIASES).items():
+        if values == text_list:
+            trace['hovertemplate'] = _TEMPLATE_FIELD.sub(lambda m: '%{' + alias + m.group(1), template)
+            del trace['text']
+            return
+
+
+def _dedupe_customdata(trace: dict):
+    """Drop 1-D customdata that repeats another per-point array, pointing the hovertemplate at that array.
+
+    Only customdata read by the hovertemplate alone is dropped; anything else
+    may be reading it, e.g. a texttemplate or click events.
+    """
+    customdata = trace.get('customdata')
+    template = trace.get('hovertemplate')
+    if customdata is None or not isinstance(template, str) or 'customdata' in str(trace.get('texttemplate', '')):
+        return
+    values = np.asarray(customdata, dtype=object)
+    if values.ndim != 1 or '%{customdata[' in template:
+        return
+    values = values.tolist()
+    for alias, other in _point_columns(trace, CUSTOMDATA_ALIASES).items():
+        if other == values:
+            trace['hovertemplate'] = _CUSTOMDATA_FIELD.sub(lambda m: '%{' + alias + m.group(1), template)
+            del trace['customdata']
+            return
+
+
+def _drop_unused_marker_keys(trace: dict):
+    """Remove colorscale settings when marker colors are literal colors"""
+    marker = trace.get('marker')
+    if not isinstance(marker, dict):
+        return
+    color = marker.get('color')
+    literal = isinstance(color, str) or (
+        isinstance(color, (list, tuple, np.ndarray)) and len(color) and isinstance(color[0], str))
+    if color is None or literal:
+        for key in NUMERIC_COLOR_KEYS:
+            marker.pop(key, None)
+
+
+def compact_payload(spec: dict, decimals: int = 2, binary_threshold: int = 64) -> dict:
+    """Shrink a figure dict for the browser: dedupe text and customdata, drop unused
+    marker keys, round to display precision and binary-encode large numeric arrays"""
+    for trace in spec.get('data', []):
+        _dedupe_text(trace)
+        _dedupe_customdata(trace)
+        _drop_unused_marker_keys(trace)
+        _compact_arrays(trace, decimals, binary_threshold)
+    return spec
+
+
+def payload_size(figure) -> int:
+    """Size in bytes of the JSON sent to the browser for a figure or figure dict"""
+    return len(pio.to_json(figure, validate=False).encode('utf-8'))
+
+
+class CompactFigure(go.Figure):
+    """Figure whose serialized form is compacted by compact_payload.
+
+    Compaction happens in to_dict, which is what Streamlit and plotly.io
+    serialize, so layout or trace updates made after the chart builders
+    return are still picked up.
+    """
+
+    compact_decimals = 2
+    binary_threshold = 64
+
+    def to_dict(self) -> dict:
+        return compact_payload(super().to_dict(), decimals=self.compact_decimals,
+                               binary_threshold=self.binary_threshold)
+
+    def __reduce__(self):
+        # Copies and pickles carry the full-precision figure, not the browser payload
+        props = go.Figure.to_dict(self)
+        props['_grid_str'] = self._grid_str
+        props['_grid_ref'] = self._grid_ref
+        return (self.__class__, (props,))
+
+    def payload_report(self) -> Dict[str, int]:
+        """Payload bytes before and after compaction"""
+        return {
+            'before': payload_size(go.Figure.to_dict(self)),
+            'after': payload_size(self.to_dict())
+        }
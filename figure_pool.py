@@ -0,0 +1,92 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import plotly.graph_objects as go
+
+from figure_payload import CompactFigure
+from figure_worker import WorkerContext, build_figure, ping, worker_init
+
+# Analyzer chart method name, positional arguments, keyword arguments
+FigureJob = Tuple[str, Sequence[Any], Dict[str, Any]]
+
+
+def _from_worker(result: Tuple[dict, Any, Any]) -> CompactFigure:
+    """Rebuild a figure dict that was already validated in the worker"""
+    spec, grid_ref, grid_str = result
+    figure = CompactFigure(spec, _validate=False)
+    figure._grid_ref, figure._grid_str = grid_ref, grid_str
+    # Later update_layout calls from the page are validated as usual
+    figure._validate = True
+    return figure
+
+
+def default_workers() -> int:
+    """Worker count from SUPPLY_CHAIN_FIGURE_WORKERS, else one per spare core up to three"""
+    configured = os.environ.get('SUPPLY_CHAIN_FIGURE_WORKERS')
+    if configured is not None:
+        return max(0, int(configured))
+    return max(0, min(3, (os.cpu_count() or 1) - 1))
+
+
+class FigurePool:
+    """Process pool that builds independent dashboard figures concurrently.
+
+    Plotly figure construction is pure Python, so threads would serialize on
+    the GIL; workers are separate processes started with ``spawn`` (safe next
+    to the server's threads) through figure_worker, and warmed up in the
+    background. Until they are ready, or when no spare core exists, figures
+    are built inline.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = default_workers() if max_workers is None else max_workers
+        if WorkerContext is None:
+            self.max_workers = 0
+        self._executor = None
+        self._warmups = []
+        if self.max_workers > 0:
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=WorkerContext(), initializer=worker_init)
+            # Submitting one ping per worker starts them all now
+            self._warmups = [self._executor.submit(ping) for _ in range(self.max_workers)]
+
+    @property
+    def ready(self) -> bool:
+        """Whether every worker has started and imported the analyzer"""
+        return (self._executor is not None and all(future.done() for future in self._warmups)
+                and not any(future.exception() for future in self._warmups))
+
+    def build(self, analyzer, jobs: Dict[str, FigureJob]) -> Dict[str, go.Figure]:
+        """Build every job, returning figures by name.
+
+        Jobs should be listed slowest first: the first one is built in this
+        process while the workers build the rest, so the total approaches the
+        slowest single figure instead of the sum.
+        """
+        names = list(jobs)
+        if not self.ready or len(names) < 2:
+            return {name: getattr(analyzer, method)(*args, **kwargs) for name, (method, args, kwargs) in jobs.items()}
+
+        try:
+            futures = {name: self._executor.submit(build_figure, *jobs[name], analyzer.reporting_currency)
+                       for name in names[1:]}
+        except BrokenProcessPool:
+            self._executor = None
+            return self.build(analyzer, jobs)
+
+        method, args, kwargs = jobs[names[0]]
+        figures = {names[0]: getattr(analyzer, method)(*args, **kwargs)}
+        for name, future in futures.items():
+            try:
+                figures[name] = _from_worker(future.result())
+            except BrokenProcessPool:
+                method, args, kwargs = jobs[name]
+                figures[name] = getattr(analyzer, method)(*args, **kwargs)
+        return {name: figures[name] for name in names}
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
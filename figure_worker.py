@@ -0,0 +1,85 @@
+"""Figure pool worker processes: their entry points and how they are started.
+
+Workers are spawned, and ``spawn`` normally re-runs the parent's ``__main__``
+in every child before the first task. Under Streamlit that is the page
+script, which would load the data and start another pool. The workers here
+are launched without a main module instead, so a child only imports this
+module and the analyzer.
+"""
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from multiprocessing import context
+from typing import Any, Dict, Sequence, Tuple
+
+_worker_analyzer = None
+
+
+def worker_init():
+    """Import the analyzer and its plotting stack once per worker process"""
+    global _worker_analyzer
+    from analyzer import AdvancedSupplyChainAnalyzer
+    _worker_analyzer = AdvancedSupplyChainAnalyzer()
+
+
+def ping() -> int:
+    return os.getpid()
+
+
+def build_figure(method: str, args: Sequence[Any], kwargs: Dict[str, Any],
+                 currency: str = 'USD') -> Tuple[dict, Any, Any]:
+    """Build one figure and return its plain dict and subplot grid; builders only need the analyzer's styling"""
+    import plotly.graph_objects as go
+
+    _worker_analyzer.reporting_currency = currency
+    figure = getattr(_worker_analyzer, method)(*args, **kwargs)
+    return go.Figure.to_dict(figure), figure._grid_ref, figure._grid_str
+
+
+if sys.platform != 'win32':
+    from multiprocessing import popen_spawn_posix, spawn
+
+    _launch_lock = threading.Lock()
+
+    @contextmanager
+    def _without_main_entries():
+        """While a worker is launched from this thread, leave the main module out of its preparation data.
+
+        Other threads launching processes meanwhile get the standard data.
+        """
+        original = spawn.get_preparation_data
+        launcher = threading.get_ident()
+
+        def preparation_data(name):
+            data = original(name)
+            if threading.get_ident() == launcher:
+                data.pop('init_main_from_name', None)
+                data.pop('init_main_from_path', None)
+            return data
+
+        with _launch_lock:
+            spawn.get_preparation_data = preparation_data
+            try:
+                yield
+            finally:
+                spawn.get_preparation_data = original
+
+    class _WorkerPopen(popen_spawn_posix.Popen):
+        """Standard spawn launcher whose children skip re-running the parent's main module"""
+
+        def _launch(self, process_obj):
+            with _without_main_entries():
+                super()._launch(process_obj)
+
+    class _WorkerProcess(context.SpawnProcess):
+        @staticmethod
+        def _Popen(process_obj):
+            return _WorkerPopen(process_obj)
+
+    class WorkerContext(context.SpawnContext):
+        """Spawn context for figure workers, for ProcessPoolExecutor's ``mp_context``"""
+        Process = _WorkerProcess
+else:
+    # Windows spawns through its own launcher, which would re-run the page script; figures are built inline there
+    WorkerContext = None
@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Sequence, Tuple
+
+from cube import MetricCube
+
+SEASON_LENGTH = 12
+
+# Output column -> monthly metric it forecasts
+FORECAST_METRICS = {
+    'Volume_USD': 'Total_Cost_USD',
+    'Delivery_Rate': 'On_Time_Delivery_Rate',
+    'Quality_Score': 'Quality_Score'
+}
+
+# Forecasts are clipped to the range the metric can take
+METRIC_BOUNDS = {
+    'Total_Cost_USD': (0, None),
+    'On_Time_Delivery_Rate': (0, 100),
+    'Quality_Score': (0, 100)
+}
+
+# Smoothing parameters tried for every series at once; each series keeps its best combination
+ALPHAS = (0.1, 0.3, 0.6)
+BETAS = (0.01, 0.1)
+GAMMAS = (0.05, 0.3)
+
+
+def fill_gaps(matrix: np.ndarray) -> np.ndarray:
+    """Carry the last observation forward along each row; leading gaps take the first observation"""
+    valid = ~np.isnan(matrix)
+    n_rows, n_cols = matrix.shape
+    columns = np.arange(n_cols)
+    # Index of the latest valid column at or before each position, -1 before the first one
+    last_valid = np.maximum.accumulate(np.where(valid, columns, -1), axis=1)
+    first_valid = np.where(valid.any(axis=1), valid.argmax(axis=1), 0)
+    source = np.where(last_valid < 0, first_valid[:, None], last_valid)
+    return matrix[np.arange(n_rows)[:, None], source]
+
+
+def _fit_block(
+    y: np.ndarray,
+    horizon: int,
+    m: int,
+    alpha: np.ndarray,
+    beta: np.ndarray,
+    gamma: np.ndarray,
+    weight: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fit every parameter combination to a block of gap-free series and forecast with the best"""
+    n_series, n_periods = y.shape
+    n_combos = alpha.shape[0]
+    if m > 1:
+        first, second = y[:, :m].mean(axis=1), y[:, m:2 * m].mean(axis=1)
+        trend0 = (second - first) / m
+        # Seasonal offsets are measured against the trend line, not the flat first-season mean
+        ramp = trend0[:, None] * (np.arange(m) - (m - 1) / 2)
+        season0 = y[:, :m] - first[:, None] - ramp
+        level0 = first + trend0 * (m - 1) / 2
+        warmup = m
+    else:
+        level0 = y[:, 0]
+        trend0 = y[:, 1] - y[:, 0] if n_periods > 1 else np.zeros(n_series)
+        season0 = np.zeros((n_series, 1))
+        warmup = 1
+
+    level = np.broadcast_to(level0, (n_combos, n_series)).copy()
+    trend = np.broadcast_to(trend0, (n_combos, n_series)).copy()
+    # Season stored month-major so each step touches one contiguous (combination, series) slab
+    season = season0.T[:, None, :] * weight[None, :, :]
+    sse = np.zeros((n_combos, n_series))
+
+    # In-place updates keep the per-step temporaries to a handful of (combination, series) arrays
+    keep_alpha, keep_beta, keep_gamma = 1 - alpha, 1 - beta, 1 - gamma
+    for t in range(warmup, n_periods):
+        observed = y[:, t]
+        slab = season[t % m]
+        predicted = level + trend
+        deseasoned = observed - slab
+        error = deseasoned - predicted
+        error *= error
+        sse += error
+
+        new_level = alpha * deseasoned
+        new_level += keep_alpha * predicted
+        trend *= keep_beta
+        trend += beta * (new_level - level)
+        slab *= keep_gamma
+        slab += gamma * (observed - new_level)
+        level = new_level
+
+    best = np.nan_to_num(sse, nan=np.inf).argmin(axis=0)
+    rows = np.arange(n_series)
+    level, trend, season = level[best, rows], trend[best, rows], season[:, best, rows].T
+
+    steps = np.arange(1, horizon + 1)
+    future_season = season[:, (n_periods + steps - 1) % m]
+    return level[:, None] + trend[:, None] * steps + future_season, best
+
+
+def holt_winters(
+    series: np.ndarray,
+    horizon: int = 6,
+    season_length: int = SEASON_LENGTH,
+    alphas: Sequence[float] = ALPHAS,
+    betas: Sequence[float] = BETAS,
+    gammas: Sequence[float] = GAMMAS,
+    block_size: int = 4096
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Additive Holt-Winters forecasts for every row of a series x time matrix.
+
+    All series in a block and all smoothing-parameter combinations are updated
+    together as (combination, series) arrays, stepping through time once; the
+    blocks only keep those arrays cache-sized. Each series keeps the
+    combination with the lowest one-step-ahead squared error, which may leave
+    out the seasonal term. With fewer than two seasons of history the
+    seasonal term is always dropped (Holt's linear trend). Returns the
+    (series, horizon) forecasts and the chosen combination index per series.
+    """
+    y = fill_gaps(np.asarray(series, dtype=np.float64))
+    seasonal = y.shape[1] >= 2 * season_length
+    m = season_length if seasonal else 1
+    if not seasonal:
+        gammas = (0.0,)
+
+    # A seasonal weight of 0 adds non-seasonal candidates, which win when the season is just noise
+    weights = (1.0, 0.0) if seasonal else (0.0,)
+    grid = np.array(np.meshgrid(alphas, betas, gammas, weights, indexing='ij')).reshape(4, -1)
+    alpha, beta, gamma, weight = (values[:, None] for values in grid)
+    gamma = gamma * weight
+
+    forecasts = np.empty((len(y), horizon))
+    best = np.empty(len(y), dtype=np.intp)
+    for start in range(0, len(y), block_size):
+        stop = start + block_size
+        forecasts[start:stop], best[start:stop] = _fit_block(y[start:stop], horizon, m, alpha, beta, gamma, weight)
+    return forecasts, best
+
+
+def monthly_grid(cube: MetricCube, metric: str) -> Tuple[np.ndarray, pd.PeriodIndex]:
+    """Supplier x calendar-month matrix of one metric, with NaN for months nobody reported"""
+    periods = pd.PeriodIndex(cube.months, freq='M')
+    calendar = pd.period_range(periods.min(), periods.max(), freq='M')
+    matrix = cube.metric_matrix(metric)
+    if len(calendar) == len(periods):
+        return matrix, calendar
+    grid = np.full((len(cube.supplier_ids), len(calendar)), np.nan, dtype=matrix.dtype)
+    grid[:, calendar.get_indexer(periods)] = matrix
+    return grid, calendar
+
+
+def forecast_cube(
+    cube: MetricCube,
+    horizon: int = 6,
+    metrics: Optional[Dict[str, str]] = None
+) -> pd.DataFrame:
+    """Forecasts for every supplier and the next ``horizon`` months, one row per pair"""
+    metrics = FORECAST_METRICS if metrics is None else metrics
+    columns = {}
+    future = None
+    for name, metric in metrics.items():
+        grid, calendar = monthly_grid(cube, metric)
+        values, _ = holt_winters(grid, horizon=horizon)
+        low, high = METRIC_BOUNDS.get(metric, (None, None))
+        if low is not None or high is not None:
+            values = np.clip(values, low, high)
+        columns[name] = values.ravel()
+        future = pd.period_range(calendar[-1] + 1, periods=horizon, freq='M')
+
+    frame = pd.DataFrame({
+        'Supplier_ID': np.repeat(cube.supplier_ids.to_numpy(), horizon),
+        'Month': np.tile(future.strftime('%Y-%m'), len(cube.supplier_ids)),
+        'Step': np.tile(np.arange(1, horizon + 1), len(cube.supplier_ids))
+    })
+    for name, values in columns.items():
+        frame[name] = values
+    return frame
@@ -0,0 +1,194 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+# Suppliers per generation block. Fixed, so the block boundaries (and with them every
+# random stream) do not depend on how many workers generate the blocks
+SUPPLIER_BLOCK_SIZE = 1024
+
+# First spawn-key entry of each stream family derived from the root seed
+SUPPLIER_STREAM = 0
+MONTHLY_STREAM = 1
+
+TIER_MULTIPLIERS = {'Tier 1': 1.0, 'Tier 2': 0.9, 'Tier 3': 0.8}
+
+TIER_1_COUNTRIES = {'Germany', 'Japan', 'USA', 'Switzerland', 'Netherlands'}
+TIER_2_COUNTRIES = {'UK', 'France', 'Italy', 'South Korea', 'Taiwan', 'Singapore'}
+
+MONTHLY_COLUMNS = [
+    'Supplier_ID', 'Month', 'Date', 'Units_Ordered', 'Units_Delivered', 'On_Time_Delivery_Rate',
+    'Quality_Score', 'Unit_Cost_USD', 'Lead_Time_Days', 'Defect_Rate_PPM', 'First_Pass_Yield',
+    'Communication_Response_Hours', 'Invoice_Accuracy_Rate', 'Sustainability_Score', 'Innovation_Score',
+    'Financial_Stability_Score', 'Capacity_Utilization', 'Total_Cost_USD', 'OTIF_Rate'
+]
+
+# Supplier master columns the monthly generator reads
+_BLOCK_COLUMNS = ['Supplier_ID', 'Supplier_Tier', 'Country', 'Annual_Volume_USD']
+
+
+def country_reliability(country: str) -> float:
+    """Reliability score for a country"""
+    if country in TIER_1_COUNTRIES:
+        return 1.0
+    elif country in TIER_2_COUNTRIES:
+        return 0.9
+    return 0.8
+
+
+def block_seed(seed: int, block: int) -> np.random.SeedSequence:
+    """Seed sequence of one monthly block.
+
+    Equal to ``SeedSequence(seed).spawn(2)[MONTHLY_STREAM].spawn(n)[block]``,
+    built directly so any block can be generated on its own.
+    """
+    return np.random.SeedSequence(seed, spawn_key=(MONTHLY_STREAM, block))
+
+
+def generate_monthly_block(
+    suppliers: pd.DataFrame,
+    seed_sequence: np.random.SeedSequence,
+    n_months: int,
+    now: datetime
+) -> pd.DataFrame:
+    """Monthly records for one block of suppliers from its own random stream.
+
+    Every field is drawn as a (supplier, month) array in a fixed order, so a
+    block's output depends only on its suppliers and its seed sequence. Rows
+    are supplier-major with the newest month first.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    n_suppliers = len(suppliers)
+    shape = (n_suppliers, n_months)
+
+    tier_multiplier = suppliers['Supplier_Tier'].map(TIER_MULTIPLIERS).to_numpy(dtype=np.float64)[:, None]
+    reliability = suppliers['Country'].map(country_reliability).to_numpy(dtype=np.float64)[:, None]
+    base_quality = np.minimum(98, 75 + tier_multiplier * 20 + reliability * 5)
+    base_delivery = np.minimum(98, 70 + tier_multiplier * 25 + reliability * 5)
+    base_cost_competitiveness = 0.7 + 0.6 * rng.random((n_suppliers, 1))
+    base_volume = suppliers['Annual_Volume_USD'].to_numpy(dtype=np.float64)[:, None] / 12
+
+    month_offsets = np.arange(n_months)
+    seasonal_factor = 1 + 0.1 * np.sin(2 * np.pi * month_offsets / 12)
+    # Step back whole calendar months so every month appears exactly once; the day is
+    # clipped to the end of shorter months
+    months = pd.period_range(end=pd.Timestamp(now).to_period('M'), periods=n_months, freq='M')[::-1]
+    dates = pd.DatetimeIndex([pd.Timestamp(now) - pd.DateOffset(months=int(offset)) for offset in month_offsets])
+
+    quality_score = np.clip(base_quality + rng.normal(0, 4, shape) * seasonal_factor, 60, 100)
+    delivery_rate = np.clip(base_delivery + rng.normal(0, 6, shape) * seasonal_factor, 60, 100)
+    monthly_volume = np.maximum(0, base_volume * rng.normal(1, 0.15, shape) * seasonal_factor)
+    units_ordered = (monthly_volume / rng.uniform(20, 80, shape)).astype(np.int64)
+    units_delivered = (units_ordered * (delivery_rate / 100)).astype(np.int64)
+    unit_cost = rng.uniform(25, 120, shape) * base_cost_competitiveness
+
+    columns = {
+        'Supplier_ID': np.repeat(suppliers['Supplier_ID'].to_numpy(dtype=object), n_months),
+        'Month': np.tile(months.strftime('%Y-%m').to_numpy(dtype=object), n_suppliers),
+        'Date': np.tile(dates.to_numpy(), n_suppliers),
+        'Units_Ordered': units_ordered,
+        'Units_Delivered': units_delivered,
+        'On_Time_Delivery_Rate': delivery_rate,
+        'Quality_Score': quality_score,
+        'Unit_Cost_USD': unit_cost,
+        'Lead_Time_Days': np.maximum(1, rng.normal(12, 5, shape).astype(np.int64)),
+        'Defect_Rate_PPM': rng.exponential(150, shape),
+        'First_Pass_Yield': np.clip(quality_score + rng.normal(0, 3, shape), 80, 100),
+        'Communication_Response_Hours': np.maximum(0.5, rng.exponential(4, shape)),
+        'Invoice_Accuracy_Rate': np.clip(96 + rng.normal(0, 2, shape), 90, 100),
+        'Sustainability_Score': np.clip(5 + reliability + rng.normal(0, 1, shape), 1, 10),
+        'Innovation_Score': np.clip(tier_multiplier * 7 + rng.normal(0, 1.5, shape), 1, 10),
+        'Financial_Stability_Score': np.clip(6 + reliability + rng.normal(0, 1, shape), 1, 10),
+        'Capacity_Utilization': np.clip(75 + rng.normal(0, 15, shape), 40, 100),
+        'Total_Cost_USD': units_delivered * unit_cost,
+        'OTIF_Rate': delivery_rate * (quality_score / 100)
+    }
+    return pd.DataFrame({name: values.ravel() for name, values in columns.items()}, columns=MONTHLY_COLUMNS)
+
+
+def _generate_block(args) -> pd.DataFrame:
+    suppliers, seed, block, n_months, now = args
+    return generate_monthly_block(suppliers, block_seed(seed, block), n_months, now)
+
+
+def iter_monthly_blocks(
+    suppliers: pd.DataFrame,
+    seed: int = 42,
+    n_months: int = 24,
+    workers: int = 1,
+    now: Optional[datetime] = None,
+    block_size: int = SUPPLIER_BLOCK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Monthly records block by block, in supplier order.
+
+    With ``workers`` above one the blocks are generated in a process pool;
+    the output is identical for any worker count. Consuming the blocks one
+    at a time (e.g. to write them out) keeps memory bounded by a few blocks.
+    """
+    now = datetime.now() if now is None else now
+    suppliers = suppliers[_BLOCK_COLUMNS]
+    tasks = ((suppliers.iloc[start:start + block_size], seed, block, n_months, now)
+             for block, start in enumerate(range(0, len(suppliers), block_size)))
+    if workers <= 1:
+        yield from map(_generate_block, tasks)
+        return
+
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        # A bounded window of submitted blocks, yielded in submission order
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_generate_block, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def generate_monthly_data(
+    suppliers: pd.DataFrame,
+    seed: int = 42,
+    n_months: int = 24,
+    workers: int = 1,
+    now: Optional[datetime] = None,
+    block_size: int = SUPPLIER_BLOCK_SIZE
+) -> pd.DataFrame:
+    """Monthly performance records for every supplier, reproducible from ``seed``"""
+    blocks = list(iter_monthly_blocks(suppliers, seed, n_months, workers, now, block_size))
+    if not blocks:
+        return pd.DataFrame(columns=MONTHLY_COLUMNS)
+    return pd.concat(blocks, ignore_index=True)
+
+
+def synthetic_suppliers(n_suppliers: int, seed: int = 42, template: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Supplier master table of any size, for load and scale testing.
+
+    Countries, categories, tiers and certifications are sampled from the
+    template portfolio (or a small built-in set); volumes are log-normal.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(SUPPLIER_STREAM,)))
+    choices: Dict[str, np.ndarray] = {
+        'Country': np.array(sorted(TIER_1_COUNTRIES | TIER_2_COUNTRIES | {'China', 'India', 'Mexico'})),
+        'Category': np.array(['Electronics', 'Mechanical Parts', 'Raw Materials', 'Logistics Services']),
+        'Supplier_Tier': np.array(list(TIER_MULTIPLIERS)),
+        'Certification_Level': np.array(['ISO9001', 'ISO9001+ISO14001', 'ISO9001+AS9100', 'None'])
+    }
+    if template is not None:
+        choices = {column: template[column].unique() for column in choices}
+
+    ids = np.char.zfill(np.arange(1, n_suppliers + 1).astype(str), max(3, len(str(n_suppliers))))
+    frame = pd.DataFrame({
+        'Supplier_ID': np.char.add('SUP', ids).astype(object),
+        'Supplier_Name': np.char.add('Supplier ', ids).astype(object)
+    })
+    for column in ['Country', 'Category', 'Supplier_Tier']:
+        frame[column] = choices[column][rng.integers(0, len(choices[column]), n_suppliers)]
+    start = np.datetime64('2019-01-01')
+    frame['Contract_Start'] = pd.to_datetime(start + rng.integers(0, 4 * 365, n_suppliers).astype('timedelta64[D]'))
+    frame['Annual_Volume_USD'] = np.round(rng.lognormal(np.log(3_500_000), 0.6, n_suppliers), -5).astype(np.int64)
+    certifications = choices['Certification_Level']
+    frame['Certification_Level'] = certifications[rng.integers(0, len(certifications), n_suppliers)]
+    return frame
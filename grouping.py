@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+
+def group_codes(keys: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Integer group codes and their labels, free for categorical keys"""
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        return keys.cat.codes.to_numpy(), keys.cat.categories
+    codes, labels = pd.factorize(keys)
+    return codes, pd.Index(labels)
+
+
+def segment_bounds(codes: np.ndarray) -> Tuple[Optional[np.ndarray], np.ndarray]:
+    """Row order that makes codes contiguous (None if already sorted) and segment starts"""
+    order = None
+    if len(codes) > 1 and (np.diff(codes) < 0).any():
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.empty(0, dtype=np.intp)
+    return order, starts
+
+
+def segment_means(
+    keys: pd.Series,
+    columns: Dict[str, np.ndarray]
+) -> Tuple[pd.Index, np.ndarray, Dict[str, np.ndarray]]:
+    """Per-group means of several columns, skipping NaN like pandas does.
+
+    Data that is already grouped (e.g. sorted by supplier) is reduced as
+    contiguous segments with ``np.add.reduceat``; unordered data is summed per
+    code with ``np.bincount`` instead of being sorted. Returns the group labels,
+    row counts per group and a mean array per column.
+    """
+    codes, labels = group_codes(keys)
+    if len(codes) > 1 and (np.diff(codes) < 0).any():
+        return _bincount_means(codes, labels, columns)
+    _, starts = segment_bounds(codes)
+    counts = np.diff(np.r_[starts, len(codes)])
+
+    means = {}
+    for name, values in columns.items():
+        values = np.asarray(values, dtype=np.float64)
+        missing = np.isnan(values)
+        if missing.any():
+            valid = np.add.reduceat(~missing, starts)
+            totals = np.add.reduceat(np.where(missing, 0.0, values), starts)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means[name] = totals / valid
+        else:
+            means[name] = np.add.reduceat(values, starts) / counts
+
+    return labels[codes[starts]], counts, means
+
+
+def _bincount_means(
+    codes: np.ndarray,
+    labels: pd.Index,
+    columns: Dict[str, np.ndarray]
+) -> Tuple[pd.Index, np.ndarray, Dict[str, np.ndarray]]:
+    """segment_means for unordered codes: one weighted bincount per column, groups in code order"""
+    keep = codes >= 0
+    if not keep.all():
+        codes = codes[keep]
+        columns = {name: np.asarray(values)[keep] for name, values in columns.items()}
+    counts = np.bincount(codes, minlength=len(labels))
+    present = np.flatnonzero(counts)
+
+    means = {}
+    for name, values in columns.items():
+        values = np.asarray(values, dtype=np.float64)
+        missing = np.isnan(values)
+        if missing.any():
+            valid = np.bincount(codes, weights=~missing, minlength=len(labels))[present]
+            totals = np.bincount(codes, weights=np.where(missing, 0.0, values), minlength=len(labels))[present]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means[name] = totals / valid
+        else:
+            means[name] = np.bincount(codes, weights=values, minlength=len(labels))[present] / counts[present]
+
+    return labels[present], counts[present], means
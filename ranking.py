@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+
+
+def top_n_positions(values, n: int, largest: bool = True) -> np.ndarray:
+    """Positions of the top (or bottom) n values, best first, via partial selection"""
+    values = np.asarray(values, dtype=np.float64)
+    size = len(values)
+    n = max(0, min(n, size))
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Rank on a key where smaller is better and missing values always lose
+    key = -values if largest else values.copy()
+    key[np.isnan(key)] = np.inf
+
+    if n < size:
+        candidates = np.argpartition(key, n - 1)[:n]
+    else:
+        candidates = np.arange(size)
+    # Only the n selected rows get fully sorted; stable so ties keep frame order
+    return candidates[np.argsort(key[candidates], kind='stable')]
+
+
+def top_n(
+    data: pd.DataFrame,
+    column: str,
+    n: int,
+    largest: bool = True,
+    ascending: bool = False,
+    others_label: Optional[str] = None,
+    label_column: Optional[str] = None,
+    others_agg: Optional[Dict[str, str]] = None
+) -> pd.DataFrame:
+    """Keep the top (or bottom) n rows by a metric without sorting the whole frame.
+
+    Rows come back best first unless ``ascending`` is set, which suits horizontal
+    bar charts. With ``others_label`` the remaining rows are rolled up into one
+    extra row labelled in ``label_column`` (or the index when it is None); numeric
+    columns are summed unless ``others_agg`` says otherwise.
+    """
+    positions = top_n_positions(data[column].to_numpy(), n, largest=largest)
+    if ascending:
+        positions = positions[::-1]
+    top = data.iloc[positions]
+
+    if others_label is None or len(positions) == len(data):
+        return top
+
+    mask = np.ones(len(data), dtype=bool)
+    mask[positions] = False
+    rest = data.iloc[np.flatnonzero(mask)]
+
+    agg = dict(others_agg or {})
+    for col in rest.columns:
+        if col not in agg and col != label_column and pd.api.types.is_numeric_dtype(rest[col]):
+            agg[col] = 'sum'
+    # One aggregate per column keeps each column's dtype: summed counts stay integers
+    others = pd.DataFrame({col: [rest[col].agg(func)] for col, func in agg.items()}) if agg else pd.DataFrame(index=[0])
+    if label_column is not None:
+        others[label_column] = others_label
+        others = others[[col for col in data.columns if col in others.columns]]
+    else:
+        others.index = [others_label]
+
+    # Others sits next to the weakest entries so the ranking reads naturally
+    parts = [others, top] if ascending else [top, others]
+    return pd.concat(parts, ignore_index=label_column is not None)
+
+
+def top_label(data: pd.DataFrame, column: str, label_column: str, largest: bool = True):
+    """Label of the single best row by a metric, or '' when no row has a value"""
+    if data.empty or data[column].isna().all():
+        return ''
+    # A single winner is a plain arg-reduction, no selection buffer needed
+    position = data[column].argmax() if largest else data[column].argmin()
+    return data[label_column].iloc[position]
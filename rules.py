@@ -0,0 +1,306 @@
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from cube import MetricCube
+
+# Rules shipped with the dashboard; user rules are added alongside them
+BUILTIN_RULES = {
+    'High risk': 'Supply_Risk_Score > 70',
+    'High risk, high spend': 'Supply_Risk_Score > 70 and Annual_Volume_USD > 5M',
+    'Defects rising': 'Defect_Rate_PPM rising 3 months in a row'
+}
+
+_SUFFIXES = {'k': 1e3, 'm': 1e6, 'b': 1e9, '%': 1.0}
+
+_TOKEN = re.compile(r'''
+    \s*(?:
+        (?P<number>\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)(?P<suffix>[kKmMbB%](?![A-Za-z_]))?
+      | (?P<op>>=|<=|==|!=|>|<|\+|-|\*|/|\(|\))
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    )''', re.VERBOSE)
+
+_KEYWORDS = {'and', 'or', 'not', 'rising', 'falling', 'months', 'month', 'in', 'a', 'row', 'for'}
+
+_COMPARE = {
+    '>': np.greater, '<': np.less, '>=': np.greater_equal,
+    '<=': np.less_equal, '==': np.equal, '!=': np.not_equal
+}
+
+_ARITHMETIC = {'+': np.add, '-': np.subtract, '*': np.multiply, '/': np.divide}
+
+
+class RuleSyntaxError(ValueError):
+    """Raised when a rule does not parse"""
+
+
+class RuleContext:
+    """Columns a rule can reference, aligned to one row per supplier.
+
+    Supplier-level columns come from the supplier frame. Monthly metrics come
+    from the metric cube: a bare name is the latest month's value and trend
+    clauses look at the trailing months.
+    """
+
+    def __init__(self, suppliers: pd.DataFrame, cube: Optional[MetricCube] = None):
+        self.suppliers = suppliers
+        self.cube = cube
+        self._rows = None
+        if cube is not None:
+            self._rows = cube.supplier_ids.get_indexer(suppliers['Supplier_ID'])
+
+    def __len__(self) -> int:
+        return len(self.suppliers)
+
+    def _align(self, values: np.ndarray, fill) -> np.ndarray:
+        """Reorder per-cube-supplier values to the supplier frame, filling suppliers without history"""
+        aligned = np.full(len(self.suppliers), fill, dtype=values.dtype)
+        present = self._rows >= 0
+        aligned[present] = values[self._rows[present]]
+        return aligned
+
+    def column(self, name: str) -> np.ndarray:
+        if name in self.suppliers.columns:
+            return self.suppliers[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        if self.cube is not None and name in self.cube.metrics:
+            latest = self.cube.metric_matrix(name)[:, -1].astype(np.float64)
+            return self._align(latest, np.nan)
+        raise KeyError(f"Unknown column '{name}' in rule")
+
+    def check_columns(self, names, source: str):
+        """Reject supplier columns a rule cannot compare numerically, such as text columns"""
+        for name in sorted(names):
+            if name in self.suppliers.columns and not pd.api.types.is_numeric_dtype(self.suppliers[name]):
+                raise RuleSyntaxError(f"Column '{name}' is not numeric and cannot be used in rule: {source!r}")
+
+    def trend(self, name: str, direction: int, months: int) -> np.ndarray:
+        if self.cube is None or name not in self.cube.metrics:
+            raise KeyError(f"Trend rules need monthly metric '{name}'")
+        window = self.cube.metric_matrix(name)[:, -(months + 1):]
+        if window.shape[1] < months + 1:
+            return np.zeros(len(self.suppliers), dtype=bool)
+        with np.errstate(invalid='ignore'):
+            steps = np.diff(window, axis=1) * direction > 0
+        return self._align(steps.all(axis=1), False)
+
+
+Expression = Callable[[RuleContext], np.ndarray]
+
+
+class _Parser:
+    """Recursive-descent parser turning rule text into nested numpy closures"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.tokens = self._tokenize(source)
+        self.position = 0
+        self.columns = set()
+
+    def _tokenize(self, source: str) -> List[Tuple[str, object]]:
+        tokens, position = [], 0
+        source = source.rstrip()
+        while position < len(source):
+            match = _TOKEN.match(source, position)
+            if match is None or match.end() == position:
+                raise RuleSyntaxError(f"Unexpected character at {position} in rule: {source!r}")
+            position = match.end()
+            if match.group('number') is not None:
+                value = float(match.group('number'))
+                suffix = match.group('suffix')
+                tokens.append(('number', value * _SUFFIXES[suffix.lower()] if suffix else value))
+            elif match.group('op') is not None:
+                tokens.append(('op', match.group('op')))
+            else:
+                word = match.group('name')
+                tokens.append(('keyword', word.lower()) if word.lower() in _KEYWORDS else ('name', word))
+        return tokens
+
+    def _peek(self) -> Tuple[Optional[str], object]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def _take(self, kind: Optional[str] = None, value=None):
+        token_kind, token_value = self._peek()
+        if token_kind is None or (kind and token_kind != kind) or (value is not None and token_value != value):
+            expected = value or kind or 'more input'
+            raise RuleSyntaxError(f"Expected {expected!r} but found {token_value!r} in rule: {self.source!r}")
+        self.position += 1
+        return token_value
+
+    def _accept(self, kind: str, value) -> bool:
+        if self._peek() == (kind, value):
+            self.position += 1
+            return True
+        return False
+
+    def parse(self) -> Expression:
+        expression = self._or()
+        if self.position != len(self.tokens):
+            raise RuleSyntaxError(f"Unexpected {self._peek()[1]!r} in rule: {self.source!r}")
+        return expression
+
+    def _or(self) -> Expression:
+        left = self._and()
+        while self._accept('keyword', 'or'):
+            left = _binary(np.logical_or, left, self._and())
+        return left
+
+    def _and(self) -> Expression:
+        left = self._not()
+        while self._accept('keyword', 'and'):
+            left = _binary(np.logical_and, left, self._not())
+        return left
+
+    def _not(self) -> Expression:
+        if self._accept('keyword', 'not'):
+            operand = self._not()
+            return lambda context: ~operand(context)
+        return self._condition()
+
+    def _condition(self) -> Expression:
+        # "(" could open a boolean group or an arithmetic term; try the group first
+        if self._peek() == ('op', '('):
+            start = self.position
+            self.position += 1
+            try:
+                inner = self._or()
+                self._take('op', ')')
+                if self._peek()[0] in (None, 'keyword') or self._peek() == ('op', ')'):
+                    return inner
+            except RuleSyntaxError:
+                pass
+            self.position = start
+
+        kind, value = self._peek()
+        following = self.tokens[self.position + 1] if self.position + 1 < len(self.tokens) else (None, None)
+        if kind == 'name' and following[0] == 'keyword' and following[1] in ('rising', 'falling'):
+            return self._trend()
+
+        left = self._sum()
+        operator = self._take('op')
+        if operator not in _COMPARE:
+            raise RuleSyntaxError(f"Expected a comparison but found {operator!r} in rule: {self.source!r}")
+        right = self._sum()
+        compare = _COMPARE[operator]
+
+        def evaluate(context: RuleContext) -> np.ndarray:
+            a, b = left(context), right(context)
+            with np.errstate(invalid='ignore'):
+                return compare(a, b) & ~(np.isnan(a) | np.isnan(b))
+        return evaluate
+
+    def _trend(self) -> Expression:
+        # <metric> rising|falling <n> months in a row   (or: for <n> months)
+        name = self._take('name')
+        self.columns.add(name)
+        direction = 1 if self._take('keyword') == 'rising' else -1
+        self._accept('keyword', 'for')
+        months = self._take('number')
+        if months != int(months) or months < 1:
+            raise RuleSyntaxError(f"Month count must be a positive integer in rule: {self.source!r}")
+        if not (self._accept('keyword', 'months') or self._accept('keyword', 'month')):
+            raise RuleSyntaxError(f"Expected 'months' in rule: {self.source!r}")
+        if self._accept('keyword', 'in'):
+            self._take('keyword', 'a')
+            self._take('keyword', 'row')
+        return lambda context: context.trend(name, direction, int(months))
+
+    def _sum(self) -> Expression:
+        left = self._product()
+        while self._peek() in (('op', '+'), ('op', '-')):
+            left = _binary(_ARITHMETIC[self._take('op')], left, self._product())
+        return left
+
+    def _product(self) -> Expression:
+        left = self._term()
+        while self._peek() in (('op', '*'), ('op', '/')):
+            left = _binary(_ARITHMETIC[self._take('op')], left, self._term())
+        return left
+
+    def _term(self) -> Expression:
+        kind, value = self._peek()
+        if kind == 'number':
+            self.position += 1
+            return lambda context: np.float64(value)
+        if kind == 'name':
+            self.position += 1
+            self.columns.add(value)
+            return lambda context: context.column(value)
+        if (kind, value) == ('op', '-'):
+            self.position += 1
+            operand = self._term()
+            return lambda context: -operand(context)
+        if (kind, value) == ('op', '('):
+            self.position += 1
+            inner = self._sum()
+            self._take('op', ')')
+            return inner
+        raise RuleSyntaxError(f"Expected a column or number but found {value!r} in rule: {self.source!r}")
+
+
+def _binary(func, left: Expression, right: Expression) -> Expression:
+    def evaluate(context: RuleContext) -> np.ndarray:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return func(left(context), right(context))
+    return evaluate
+
+
+def compile_rule(source: str, context: Optional[RuleContext] = None) -> Expression:
+    """Parse a rule once into a function from a RuleContext to a per-supplier boolean mask.
+
+    With a context, the columns the rule references are checked against its
+    data so a rule over a text column is rejected here rather than on every
+    evaluation.
+    """
+    parser = _Parser(source)
+    expression = parser.parse()
+    if context is not None:
+        context.check_columns(parser.columns, source)
+    return expression
+
+
+class RuleSet:
+    """Named rules compiled once and evaluated together on every refresh"""
+
+    def __init__(self, rules: Optional[Dict[str, str]] = None):
+        self.sources: Dict[str, str] = {}
+        self.compiled: Dict[str, Expression] = {}
+        for name, source in (BUILTIN_RULES if rules is None else rules).items():
+            self.add(name, source)
+
+    def add(self, name: str, source: str, context: Optional[RuleContext] = None):
+        """Compile and register a rule, replacing any rule of the same name"""
+        self.compiled[name] = compile_rule(source, context)
+        self.sources[name] = source
+
+    def copy(self) -> 'RuleSet':
+        """Independent rule set sharing the already compiled expressions"""
+        other = RuleSet({})
+        other.sources, other.compiled = dict(self.sources), dict(self.compiled)
+        return other
+
+    def evaluate(self, context: RuleContext) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Masks for every rule (one column per rule) and a summary with match counts and timings.
+
+        A rule that references a column the data does not have, or otherwise
+        fails to evaluate, matches nothing and reports the problem in the
+        summary's Error column; the other rules are unaffected.
+        """
+        masks, summary = {}, []
+        for name, expression in self.compiled.items():
+            start = time.perf_counter()
+            error = None
+            try:
+                mask = np.broadcast_to(np.asarray(expression(context), dtype=bool), (len(context),))
+            except KeyError as exc:
+                mask, error = np.zeros(len(context), dtype=bool), exc.args[0]
+            except (TypeError, ValueError) as exc:
+                mask, error = np.zeros(len(context), dtype=bool), str(exc)
+            elapsed = time.perf_counter() - start
+            masks[name] = mask
+            summary.append({'Rule': name, 'Expression': self.sources[name], 'Matches': int(mask.sum()),
+                            'Milliseconds': elapsed * 1000, 'Error': error})
+        frame = pd.DataFrame(masks, index=pd.Index(context.suppliers['Supplier_ID'], name='Supplier_ID'))
+        return frame, pd.DataFrame(summary, columns=['Rule', 'Expression', 'Matches', 'Milliseconds', 'Error'])
@@ -0,0 +1,129 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ranking import top_n_positions
+
+# Score component -> (monthly metric averaged per supplier, whether higher is better)
+SCORE_COMPONENTS: Dict[str, Tuple[str, bool]] = {
+    'Quality': ('Quality_Score', True),
+    'Delivery': ('On_Time_Delivery_Rate', True),
+    'Cost': ('Unit_Cost_USD', False),
+    'Sustainability': ('Sustainability_Score', True),
+    'Innovation': ('Innovation_Score', True),
+    'Financial Stability': ('Financial_Stability_Score', True)
+}
+
+# Relative weights on a 0-10 scale; quality and delivery weigh equally, like Overall_Performance_Score
+DEFAULT_WEIGHTS = {'Quality': 5.0, 'Delivery': 5.0, 'Cost': 0.0, 'Sustainability': 0.0,
+                   'Innovation': 0.0, 'Financial Stability': 0.0}
+
+
+def normalize_components(means: pd.DataFrame, components: Dict[str, Tuple[str, bool]] = SCORE_COMPONENTS) -> np.ndarray:
+    """Supplier x component matrix on a 0-100 scale, 100 being the best supplier on that component.
+
+    Each metric is min-max scaled across suppliers (inverted where lower is
+    better); suppliers without data for a metric get the component's mean.
+    """
+    matrix = np.empty((len(means), len(components)), dtype=np.float64)
+    for j, (metric, higher_is_better) in enumerate(components.values()):
+        values = means[metric].to_numpy(dtype=np.float64)
+        observed = values[~np.isnan(values)]
+        if len(observed) == 0 or observed.min() == observed.max():
+            matrix[:, j] = 50.0
+            continue
+        scaled = (values - observed.min()) / (observed.max() - observed.min()) * 100
+        if not higher_is_better:
+            scaled = 100 - scaled
+        matrix[:, j] = np.where(np.isnan(scaled), np.nanmean(scaled), scaled)
+    return matrix
+
+
+class PerformanceScorer:
+    """Weighted performance scores over a normalized supplier x component matrix.
+
+    The matrix is built once per dataset; a weight change recomputes every
+    score as one matrix-vector product and nothing else. Re-ranking is
+    incremental: the top suppliers come from a partial selection, and the
+    full order is only re-sorted when asked for, starting from the previous
+    order with a stable (adaptive) sort.
+    """
+
+    def __init__(self, supplier_ids: pd.Index, matrix: np.ndarray, components: List[str],
+                 weights: Optional[Dict[str, float]] = None, names: Optional[np.ndarray] = None):
+        self.supplier_ids = pd.Index(supplier_ids, name='Supplier_ID')
+        self.names = None if names is None else np.asarray(names, dtype=object)
+        self.matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+        self.components = list(components)
+        self._weights = np.zeros(len(self.components))
+        self._raw = np.zeros(len(self.supplier_ids))
+        self._order = np.arange(len(self.supplier_ids))
+        self._ranked = False
+        self.set_weights(DEFAULT_WEIGHTS if weights is None else weights)
+
+    @classmethod
+    def from_means(cls, means: pd.DataFrame, components: Dict[str, Tuple[str, bool]] = SCORE_COMPONENTS,
+                   weights: Optional[Dict[str, float]] = None, names: Optional[pd.Series] = None) -> 'PerformanceScorer':
+        """Scorer over per-supplier metric means indexed by supplier; ``names`` maps supplier to display name"""
+        labels = None if names is None else names.reindex(means.index).to_numpy()
+        return cls(means.index, normalize_components(means, components), list(components), weights, labels)
+
+    @property
+    def weights(self) -> Dict[str, float]:
+        return dict(zip(self.components, self._weights.tolist()))
+
+    def set_weights(self, weights: Dict[str, float]) -> np.ndarray:
+        """Apply new component weights (missing ones keep their value) and return the scores"""
+        unknown = set(weights) - set(self.components)
+        if unknown:
+            raise KeyError(f"Unknown score components: {', '.join(sorted(unknown))}")
+        new = self._weights.copy()
+        for name, weight in weights.items():
+            if weight < 0:
+                raise ValueError(f"Weight of '{name}' must not be negative")
+            new[self.components.index(name)] = weight
+
+        if np.array_equal(new, self._weights):
+            return self.scores
+        self._weights = new
+        self._raw = self.matrix @ new
+        self._ranked = False
+        return self.scores
+
+    @property
+    def scores(self) -> np.ndarray:
+        """Weighted scores on the 0-100 scale; equal weights when every weight is zero"""
+        total = self._weights.sum()
+        if total <= 0:
+            return self.matrix.mean(axis=1)
+        return self._raw / total
+
+    def ranking(self) -> np.ndarray:
+        """Supplier positions, best score first (ties keep the previous order)"""
+        if not self._ranked:
+            key = -self.scores
+            self._order = self._order[np.argsort(key[self._order], kind='stable')]
+            self._ranked = True
+        return self._order
+
+    def ranks(self) -> np.ndarray:
+        """Rank of every supplier, 1 being the best"""
+        ranks = np.empty(len(self._order), dtype=np.int64)
+        ranks[self.ranking()] = np.arange(1, len(self._order) + 1)
+        return ranks
+
+    def top(self, n: Optional[int] = None) -> pd.DataFrame:
+        """The n best suppliers (all when None) with their score, rank and component scores"""
+        if n is None or self._ranked:
+            positions = self.ranking()[:n]
+        else:
+            # Partial selection: no full sort while the weights keep moving
+            positions = top_n_positions(self.scores, n)
+        frame = pd.DataFrame(self.matrix[positions], columns=self.components)
+        frame.insert(0, 'Rank', np.arange(1, len(positions) + 1))
+        frame.insert(1, 'Supplier_ID', self.supplier_ids[positions])
+        if self.names is not None:
+            frame.insert(2, 'Supplier_Name', self.names[positions])
+        frame.insert(len(frame.columns) - len(self.components), 'Weighted_Score', self.scores[positions])
+        return frame
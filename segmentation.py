@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+
+# Metric vector used to place each supplier in a segment
+SEGMENT_FEATURES = [
+    'Overall_Performance_Score',
+    'Supply_Risk_Score',
+    'Avg_Unit_Cost',
+    'Quality_Score',
+    'Delivery_Score',
+    'Sustainability_Score'
+]
+
+
+def _standardize(X: np.ndarray) -> np.ndarray:
+    """Z-score each column, filling missing values with the column mean"""
+    X = np.asarray(X, dtype=np.float64)
+    mean = np.nanmean(X, axis=0)
+    std = np.nanstd(X, axis=0)
+    std[~np.isfinite(std) | (std == 0)] = 1.0
+    mean[~np.isfinite(mean)] = 0.0
+    Z = (X - mean) / std
+    Z[~np.isfinite(Z)] = 0.0
+    return Z
+
+
+def _nearest_center(X: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """Index of the closest center for every row of X"""
+    # ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2, the ||x||^2 term does not change the argmin
+    distances = (centers ** 2).sum(axis=1) - 2 * X @ centers.T
+    return distances.argmin(axis=1)
+
+
+def _kmeans_plus_plus(X: np.ndarray, n_clusters: int, rng: np.random.Generator) -> np.ndarray:
+    """Seed cluster centers with k-means++ on a sample of the rows"""
+    centers = np.empty((n_clusters, X.shape[1]))
+    centers[0] = X[rng.integers(len(X))]
+    closest = ((X - centers[0]) ** 2).sum(axis=1)
+    for i in range(1, n_clusters):
+        total = closest.sum()
+        if total <= 0:
+            centers[i] = X[rng.integers(len(X))]
+        else:
+            centers[i] = X[rng.choice(len(X), p=closest / total)]
+        closest = np.minimum(closest, ((X - centers[i]) ** 2).sum(axis=1))
+    return centers
+
+
+def minibatch_kmeans(
+    X: np.ndarray,
+    n_clusters: int = 4,
+    batch_size: int = 1024,
+    max_iter: int = 100,
+    tol: float = 1e-4,
+    chunk_size: int = 65536,
+    random_state: int = 42
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Mini-batch k-means; returns (centers, labels) using bounded memory per step"""
+    X = np.asarray(X, dtype=np.float64)
+    n_samples = len(X)
+    if n_samples == 0:
+        return np.empty((0, X.shape[1])), np.empty(0, dtype=np.int64)
+    n_clusters = max(1, min(n_clusters, n_samples))
+    rng = np.random.default_rng(random_state)
+
+    # Seed from a bounded sample so initialization cost does not grow with the portfolio
+    sample_size = min(n_samples, max(10 * n_clusters, batch_size))
+    sample = X[rng.choice(n_samples, size=sample_size, replace=False)]
+    centers = _kmeans_plus_plus(sample, n_clusters, rng)
+    counts = np.zeros(n_clusters)
+
+    batch_size = min(batch_size, n_samples)
+    for _ in range(max_iter):
+        batch = X[rng.choice(n_samples, size=batch_size, replace=False)]
+        labels = _nearest_center(batch, centers)
+
+        # Per-center running mean update (Sculley, 2010) done for the whole batch at once
+        batch_counts = np.bincount(labels, minlength=n_clusters).astype(np.float64)
+        batch_sums = np.zeros_like(centers)
+        np.add.at(batch_sums, labels, batch)
+        counts += batch_counts
+        seen = batch_counts > 0
+        previous = centers.copy()
+        centers[seen] += (batch_sums[seen] - batch_counts[seen, None] * centers[seen]) / counts[seen, None]
+
+        if np.sqrt(((centers - previous) ** 2).sum(axis=1)).max() < tol:
+            break
+
+    # Final assignment in chunks to keep the distance matrix small
+    labels = np.empty(n_samples, dtype=np.int64)
+    for start in range(0, n_samples, chunk_size):
+        labels[start:start + chunk_size] = _nearest_center(X[start:start + chunk_size], centers)
+
+    return centers, labels
+
+
+def segment_suppliers(
+    metrics: pd.DataFrame,
+    n_segments: int = 4,
+    features: Optional[List[str]] = None,
+    rank_by: str = 'Overall_Performance_Score',
+    random_state: int = 42
+) -> pd.Series:
+    """Cluster suppliers on their metric vectors and return a 'Segment N' label per row"""
+    features = [col for col in (features or SEGMENT_FEATURES) if col in metrics.columns]
+    if not features or metrics.empty:
+        return pd.Series('Segment 1', index=metrics.index, name='Segment')
+
+    X = _standardize(metrics[features].to_numpy(dtype=np.float64))
+    centers, labels = minibatch_kmeans(X, n_clusters=n_segments, random_state=random_state)
+
+    # Number segments from best to worst so labels are stable and readable
+    if rank_by in features:
+        order = np.argsort(-centers[:, features.index(rank_by)])
+    else:
+        order = np.arange(len(centers))
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    return pd.Series(
+        np.char.add('Segment ', (rank[labels] + 1).astype(str)),
+        index=metrics.index,
+        name='Segment'
+    )
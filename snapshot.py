@@ -0,0 +1,124 @@
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Bumped whenever the on-disk layout changes; older snapshots are rejected on load
+SNAPSHOT_FORMAT_VERSION = 1
+
+MANIFEST_NAME = 'manifest.json'
+
+# Column dtypes stored as raw .npy arrays and memory-mapped back as is
+_RAW_KINDS = 'biufmM'
+
+
+def _encode_column(series: pd.Series) -> Tuple[str, Dict[str, np.ndarray]]:
+    """Split a column into memory-mappable arrays; strings become codes plus labels"""
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes, labels = series.cat.codes.to_numpy(), series.cat.categories
+        kind = 'categorical'
+    elif dtype == object or pd.api.types.is_string_dtype(dtype):
+        codes, labels = pd.factorize(series)
+        kind = 'string'
+    elif dtype.kind in _RAW_KINDS and not getattr(dtype, 'tz', None):
+        return 'raw', {'values': np.ascontiguousarray(series.to_numpy())}
+    else:
+        raise TypeError(f"Column '{series.name}' has unsupported dtype {dtype}")
+
+    if not all(isinstance(label, str) for label in labels):
+        raise TypeError(f"Column '{series.name}' mixes strings with other objects")
+    return kind, {
+        'codes': codes.astype(np.int32),
+        'labels': np.asarray(labels, dtype=str)
+    }
+
+
+def _decode_column(kind: str, arrays: Dict[str, np.ndarray]) -> Any:
+    """Inverse of _encode_column; raw columns stay memory-mapped"""
+    if kind == 'raw':
+        return arrays['values']
+    categorical = pd.Categorical.from_codes(arrays['codes'], arrays['labels'].astype(object))
+    if kind == 'categorical':
+        return categorical
+    return np.asarray(categorical, dtype=object)
+
+
+def write_snapshot(path: str, tables: Dict[str, pd.DataFrame], metadata: Optional[Dict[str, Any]] = None) -> Dict:
+    """Write frames as per-column .npy files plus a JSON manifest.
+
+    The snapshot is built in a temporary sibling directory and swapped in at
+    the end, so readers never see a half-written snapshot.
+    """
+    path = os.path.abspath(path)
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.snapshot-', dir=parent)
+
+    manifest = {
+        'format_version': SNAPSHOT_FORMAT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'metadata': metadata or {},
+        'tables': {}
+    }
+    try:
+        for table, frame in tables.items():
+            os.makedirs(os.path.join(staging, table))
+            columns = []
+            for position, column in enumerate(frame.columns):
+                kind, arrays = _encode_column(frame[column])
+                files = {}
+                for part, array in arrays.items():
+                    files[part] = f'{table}/{position:03d}.{part}.npy'
+                    np.save(os.path.join(staging, files[part]), array, allow_pickle=False)
+                columns.append({'name': column, 'dtype': str(frame[column].dtype), 'kind': kind, 'files': files})
+            manifest['tables'][table] = {'rows': len(frame), 'columns': columns}
+
+        with open(os.path.join(staging, MANIFEST_NAME), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.replace(staging, path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return manifest
+
+
+def read_manifest(path: str) -> Dict:
+    """Read and check a snapshot manifest"""
+    with open(os.path.join(path, MANIFEST_NAME)) as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f"Snapshot format {manifest.get('format_version')} is not supported "
+            f"(expected {SNAPSHOT_FORMAT_VERSION}); regenerate the snapshot"
+        )
+    return manifest
+
+
+def read_snapshot(path: str, mmap_mode: Optional[str] = 'c') -> Tuple[Dict[str, pd.DataFrame], Dict]:
+    """Load every table of a snapshot and its manifest.
+
+    Numeric and datetime columns are memory-mapped; the default copy-on-write
+    mode shares pages between processes until a column is modified in place.
+    """
+    manifest = read_manifest(path)
+    tables = {}
+    for table, spec in manifest['tables'].items():
+        columns = {}
+        for column in spec['columns']:
+            arrays = {
+                part: np.load(os.path.join(path, file), mmap_mode=mmap_mode, allow_pickle=False)
+                for part, file in column['files'].items()
+            }
+            columns[column['name']] = _decode_column(column['kind'], arrays)
+        # copy=False keeps each memory-mapped column as its own block
+        tables[table] = pd.DataFrame(columns, copy=False)
+    return tables, manifest
@@ -0,0 +1,202 @@
+import sqlite3
+import pandas as pd
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Fact table indexes: drill-down by supplier over time, and category/year slicing
+PERFORMANCE_INDEXES = {
+    'idx_performance_supplier_month': ('Supplier_ID', 'Month'),
+    'idx_performance_category_year': ('Category', 'Year')
+}
+
+# Metrics averaged per category when aggregating in SQL
+CATEGORY_METRICS = [
+    'Quality_Score', 'On_Time_Delivery_Rate', 'OTIF_Rate', 'Unit_Cost_USD',
+    'Lead_Time_Days', 'Defect_Rate_PPM', 'Sustainability_Score'
+]
+
+# SQL aggregate for each per-supplier aggregation the analyzer offers
+SUPPLIER_AGGREGATES = {'mean': 'AVG', 'sum': 'SUM', 'count': 'COUNT'}
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a column or table name for SQL, so it is never read as SQL text"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SQLiteStore:
+    """Embedded SQLite storage for the supplier master and monthly performance facts"""
+
+    def __init__(self, path: str = ':memory:'):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self._column_types = None
+
+    def close(self):
+        """Close the underlying connection"""
+        self.connection.close()
+
+    def has_data(self) -> bool:
+        """Whether both tables exist and the fact table has rows"""
+        tables = {row[0] for row in self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )}
+        if not {'suppliers', 'performance'} <= tables:
+            return False
+        return self.connection.execute('SELECT EXISTS (SELECT 1 FROM performance)').fetchone()[0] == 1
+
+    def write(self, suppliers: pd.DataFrame, monthly: pd.DataFrame, chunksize: int = 50000):
+        """Replace the stored tables and (re)build the fact table indexes"""
+        facts = self._facts(suppliers, monthly)
+
+        with self.connection:
+            suppliers.to_sql('suppliers', self.connection, if_exists='replace', index=False, chunksize=chunksize)
+            facts.to_sql('performance', self.connection, if_exists='replace', index=False, chunksize=chunksize)
+            self.connection.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_suppliers_id ON suppliers (Supplier_ID)')
+            for name, columns in PERFORMANCE_INDEXES.items():
+                self.connection.execute(f'CREATE INDEX IF NOT EXISTS {quote_identifier(name)} '
+                                        f'ON performance ({", ".join(map(quote_identifier, columns))})')
+            self.connection.execute('ANALYZE')
+        self._column_types = None
+
+    def append_performance(self, suppliers: pd.DataFrame, monthly: pd.DataFrame, chunksize: int = 50000):
+        """Add monthly records to the fact table; the existing indexes are kept up to date by SQLite"""
+        with self.connection:
+            self._facts(suppliers, monthly).to_sql('performance', self.connection, if_exists='append',
+                                                   index=False, chunksize=chunksize)
+            self.connection.execute('ANALYZE')
+
+    @staticmethod
+    def _facts(suppliers: pd.DataFrame, monthly: pd.DataFrame) -> pd.DataFrame:
+        """Monthly records with the denormalized Category and Year filter columns"""
+        facts = monthly.merge(suppliers[['Supplier_ID', 'Category']], on='Supplier_ID', how='left')
+        facts['Year'] = facts['Month'].str[:4].astype(int)
+        return facts
+
+    @property
+    def column_types(self) -> Dict[str, str]:
+        """Declared SQL type of every fact table column, read once per write"""
+        if self._column_types is None:
+            rows = self.connection.execute('PRAGMA table_info(performance)').fetchall()
+            self._column_types = {row[1]: row[2].upper() for row in rows}
+        return self._column_types
+
+    def _columns(self, columns: Sequence[str]) -> str:
+        """Quoted select list; names outside the fact table are rejected rather than passed to SQL"""
+        unknown = [column for column in columns if column not in self.column_types]
+        if unknown:
+            raise KeyError(f"Unknown performance columns: {', '.join(map(str, unknown))}")
+        return ', '.join(map(quote_identifier, columns))
+
+    def query(
+        self,
+        sql: str,
+        params: Sequence = (),
+        parse_dates: Optional[List[str]] = None,
+        chunksize: Optional[int] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """Run a query and return a frame, or an iterator of frames when chunksize is set"""
+        return pd.read_sql_query(sql, self.connection, params=list(params),
+                                 parse_dates=parse_dates, chunksize=chunksize)
+
+    def load_suppliers(self) -> pd.DataFrame:
+        """Read the supplier master table"""
+        return self.query('SELECT * FROM suppliers', parse_dates=['Contract_Start'])
+
+    def load_performance(self, chunksize: Optional[int] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """Read the monthly fact table without the denormalized filter columns"""
+        frames = self.query('SELECT * FROM performance ORDER BY Supplier_ID, Month',
+                            parse_dates=['Date'], chunksize=chunksize)
+        if chunksize is None:
+            return frames.drop(columns=['Category', 'Year'])
+        return (frame.drop(columns=['Category', 'Year']) for frame in frames)
+
+    def _where(
+        self,
+        year: Optional[int] = None,
+        category: Optional[str] = None,
+        supplier_ids: Optional[Sequence[str]] = None,
+        month_range: Optional[Tuple[str, str]] = None
+    ) -> Tuple[str, list]:
+        """Build a WHERE clause and its parameters from the optional filters"""
+        clauses, params = [], []
+        if category is not None:
+            clauses.append('Category = ?')
+            params.append(category)
+        if year is not None:
+            clauses.append('Year = ?')
+            params.append(int(year))
+        if supplier_ids is not None:
+            supplier_ids = list(supplier_ids)
+            clauses.append(f'Supplier_ID IN ({", ".join("?" * len(supplier_ids))})')
+            params.extend(supplier_ids)
+        if month_range is not None:
+            clauses.append('Month BETWEEN ? AND ?')
+            params.extend(month_range)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def filter_performance(
+        self,
+        year: Optional[int] = None,
+        category: Optional[str] = None,
+        supplier_ids: Optional[Sequence[str]] = None,
+        month_range: Optional[Tuple[str, str]] = None,
+        columns: Optional[List[str]] = None,
+        chunksize: Optional[int] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """Filter the fact table in SQL using the indexes"""
+        where, params = self._where(year, category, supplier_ids, month_range)
+        select = self._columns(columns) if columns else '*'
+        parse_dates = ['Date'] if not columns or 'Date' in columns else None
+        return self.query(f'SELECT {select} FROM performance{where}', params,
+                          parse_dates=parse_dates, chunksize=chunksize)
+
+    def aggregate_by_category(
+        self,
+        year: Optional[int] = None,
+        month_range: Optional[Tuple[str, str]] = None
+    ) -> pd.DataFrame:
+        """Per-category supplier counts, spend and average metrics computed in SQL"""
+        where, params = self._where(year=year, month_range=month_range)
+        averages = ', '.join(f'AVG({quote_identifier(col)}) AS {quote_identifier("Avg_" + col)}'
+                             for col in CATEGORY_METRICS)
+        return self.query(
+            'SELECT Category, COUNT(DISTINCT Supplier_ID) AS Supplier_Count, '
+            f'SUM(Total_Cost_USD) AS Total_Volume_USD, {averages} '
+            f'FROM performance{where} GROUP BY Category ORDER BY Category',
+            params
+        )
+
+    def aggregate_by_supplier(
+        self,
+        month_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
+        how: str = 'mean',
+        metrics: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Per-supplier mean, sum or count of fact columns over a month range, indexed by Supplier_ID.
+
+        Only suppliers with records in the range are returned; ``metrics``
+        defaults to every numeric column.
+        """
+        if how not in SUPPLIER_AGGREGATES:
+            raise ValueError(f"Unsupported aggregation '{how}'; use 'mean', 'sum' or 'count'")
+        if metrics is None:
+            metrics = [column for column, kind in self.column_types.items()
+                       if kind in ('INTEGER', 'REAL') and column != 'Year']
+        self._columns(metrics)
+        if month_range is not None:
+            start, end = month_range
+            month_range = (start or '0000-01', end or '9999-12')
+        where, params = self._where(month_range=month_range)
+        function = SUPPLIER_AGGREGATES[how]
+        aggregates = ', '.join(f'{function}({quote_identifier(col)}) AS {quote_identifier(col)}' for col in metrics)
+        result = self.query(f'SELECT Supplier_ID, {aggregates} FROM performance{where} GROUP BY Supplier_ID', params)
+        return result.set_index('Supplier_ID')
+
+    def supplier_history(self, supplier_id: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """One supplier's monthly history, served by the (Supplier_ID, Month) index"""
+        select = self._columns(columns) if columns else '*'
+        parse_dates = ['Date'] if not columns or 'Date' in columns else None
+        return self.query(f'SELECT {select} FROM performance WHERE Supplier_ID = ? ORDER BY Month',
+                          [supplier_id], parse_dates=parse_dates)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple
+
+from ranking import top_n_positions
+
+# ColorBrewer RdYlGn, low (red) to high (green)
+RDYLGN = np.array([
+    '#a50026', '#d73027', '#f46d43', '#fdae61', '#fee08b', '#ffffbf',
+    '#d9ef8b', '#a6d96a', '#66bd63', '#1a9850', '#006837'
+])
+
+
+def _text_colors(palette: np.ndarray) -> np.ndarray:
+    """Dark or light text per background so every cell stays readable"""
+    rgb = np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in palette]) / 255
+    luminance = rgb @ np.array([0.2126, 0.7152, 0.0722])
+    return np.where(luminance > 0.408, '#000000', '#f1f1f1')
+
+
+RDYLGN_CSS = np.char.add(
+    np.char.add(np.char.add('background-color: ', RDYLGN), '; color: '),
+    _text_colors(RDYLGN)
+).astype(object)
+
+
+def gradient_styles(values, vmin: float = 0, vmax: float = 100, reverse: bool = False) -> np.ndarray:
+    """CSS cell styles on the RdYlGn scale, computed for a whole column at once"""
+    values = np.asarray(values, dtype=np.float64)
+    scaled = np.clip((values - vmin) / (vmax - vmin), 0, 1)
+    if reverse:
+        scaled = 1 - scaled
+    index = np.rint(np.nan_to_num(scaled, nan=0.5) * (len(RDYLGN) - 1)).astype(np.intp)
+    return RDYLGN_CSS[index]
+
+
+def page_count(n_rows: int, page_size: int) -> int:
+    """Number of pages needed for n_rows, at least one"""
+    return max(1, -(-n_rows // page_size))
+
+
+def table_page(
+    data: pd.DataFrame,
+    sort_by: str,
+    descending: bool,
+    page: int,
+    page_size: int
+) -> pd.DataFrame:
+    """One sorted page of a frame; numeric sorts only order the rows up to that page"""
+    page = min(max(page, 1), page_count(len(data), page_size))
+    start, stop = (page - 1) * page_size, page * page_size
+
+    column = data[sort_by]
+    if pd.api.types.is_numeric_dtype(column):
+        positions = top_n_positions(column.to_numpy(), stop, largest=descending)[start:stop]
+    else:
+        order = np.argsort(column.to_numpy().astype(str), kind='stable')
+        positions = (order[::-1] if descending else order)[start:stop]
+    return data.iloc[positions]
+
+
+def styled_page(page: pd.DataFrame, gradients: Dict[str, Tuple[float, float, bool]]):
+    """Styler that only paints the precomputed gradient colors of one page"""
+    styles = pd.DataFrame('', index=page.index, columns=page.columns)
+    for column, (vmin, vmax, reverse) in gradients.items():
+        styles[column] = gradient_styles(page[column].to_numpy(), vmin, vmax, reverse)
+    return page.style.apply(lambda _: styles, axis=None)
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Sequence, Tuple
+
+from cube import MetricCube
+
+
+def _month_bounds(months: pd.Index, start=None, end=None) -> Tuple[int, int]:
+    """Positions [lo, hi) of the sorted months falling in [start, end], found by binary search"""
+    lo = 0 if start is None else int(months.searchsorted(start, side='left'))
+    hi = len(months) if end is None else int(months.searchsorted(end, side='right'))
+    return lo, max(lo, hi)
+
+
+class MonthPartitions:
+    """Monthly records sorted by month once, with the row offset where each month starts.
+
+    Every month is a contiguous block of rows, so the records of any month
+    range are a single ``iloc`` slice: two binary searches, no scan of the
+    other rows and no copy (the slice is a view and must not be modified).
+    """
+
+    def __init__(self, records: pd.DataFrame, month_column: str = 'Month'):
+        codes, months = pd.factorize(records[month_column], sort=True)
+        order = np.argsort(codes, kind='stable')
+        self.records = records.take(order).reset_index(drop=True)
+        self.months = pd.Index(months, name=month_column)
+        self.offsets = np.zeros(len(months) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(months)), out=self.offsets[1:])
+
+    def rows(self, start=None, end=None) -> pd.DataFrame:
+        """Records of the months in [start, end], oldest month first"""
+        lo, hi = _month_bounds(self.months, start, end)
+        return self.records.iloc[self.offsets[lo]:self.offsets[hi]]
+
+    def row_count(self, start=None, end=None) -> int:
+        lo, hi = _month_bounds(self.months, start, end)
+        return int(self.offsets[hi] - self.offsets[lo])
+
+
+class CumulativeCube:
+    """Running totals of a MetricCube along the month axis.
+
+    ``sums[:, m]`` and ``counts[:, m]`` hold the totals and the number of
+    reported cells over the first ``m`` months, so the sum, count or mean of
+    any month range is one subtraction per supplier and metric instead of a
+    pass over the range. Like the cube, they see one value per supplier and
+    month (duplicate records are averaged). Totals are float64 to keep the
+    differences exact enough for long histories, so each metric costs 12
+    bytes per supplier and month: pass ``metrics`` to keep only the ones
+    that are aggregated over ranges.
+    """
+
+    def __init__(self, cube: MetricCube, metrics: Optional[Sequence[str]] = None):
+        if metrics is None:
+            values, self.metrics = cube.values, cube.metrics
+        else:
+            positions = cube.metrics.get_indexer(metrics)
+            if (positions < 0).any():
+                missing = [metric for metric, position in zip(metrics, positions) if position < 0]
+                raise KeyError(f"Metrics not in the cube: {', '.join(missing)}")
+            values, self.metrics = cube.values[:, :, positions], cube.metrics[positions]
+        observed = ~np.isnan(values)
+        n_suppliers, n_months, n_metrics = values.shape
+        self.supplier_ids = cube.supplier_ids
+        self.months = cube.months
+        self.sums = np.zeros((n_suppliers, n_months + 1, n_metrics), dtype=np.float64)
+        self.counts = np.zeros((n_suppliers, n_months + 1, n_metrics), dtype=np.int32)
+        np.cumsum(np.where(observed, values, 0), axis=1, dtype=np.float64, out=self.sums[:, 1:])
+        np.cumsum(observed, axis=1, dtype=np.int32, out=self.counts[:, 1:])
+
+    def aggregate(self, start=None, end=None, how: str = 'mean', metrics: Optional[List[str]] = None) -> pd.DataFrame:
+        """Per-supplier ``mean``, ``sum`` or ``count`` of the months in [start, end].
+
+        Sums of suppliers with nothing reported in the range are 0, means NaN.
+        """
+        lo, hi = _month_bounds(self.months, start, end)
+        positions = slice(None) if metrics is None else self.metrics.get_indexer(metrics)
+        if metrics is not None and (positions < 0).any():
+            missing = [metric for metric, position in zip(metrics, positions) if position < 0]
+            raise KeyError(f"Running totals not kept for: {', '.join(missing)}")
+        labels = self.metrics if metrics is None else self.metrics[positions]
+        counts = self.counts[:, hi, positions] - self.counts[:, lo, positions]
+        if how == 'count':
+            result = counts
+        else:
+            sums = self.sums[:, hi, positions] - self.sums[:, lo, positions]
+            if how == 'sum':
+                result = sums
+            elif how == 'mean':
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    result = np.where(counts > 0, sums / counts, np.nan)
+            else:
+                raise ValueError(f"Unsupported aggregation '{how}'; use 'mean', 'sum' or 'count'")
+        return pd.DataFrame(result, index=self.supplier_ids, columns=labels)
+
+
+class SupplierTimelines:
+    """Monthly records sorted by supplier, then month, with each supplier's row range.
+
+    A supplier's full history is one dictionary lookup and one ``iloc``
+    slice, whatever the size of the table; the slice is a view and must not
+    be modified.
+    """
+
+    def __init__(self, records: pd.DataFrame, supplier_column: str = 'Supplier_ID', month_column: str = 'Month'):
+        supplier_codes, supplier_ids = pd.factorize(records[supplier_column], sort=True)
+        month_codes, _ = pd.factorize(records[month_column], sort=True)
+        # lexsort sorts by the last key first: supplier, then month within a supplier
+        order = np.lexsort((month_codes, supplier_codes))
+        self.records = records.take(order).reset_index(drop=True)
+        self.supplier_ids = pd.Index(supplier_ids, name=supplier_column)
+        self.offsets = np.zeros(len(supplier_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(supplier_codes, minlength=len(supplier_ids)), out=self.offsets[1:])
+        self.supplier_index = {supplier: i for i, supplier in enumerate(supplier_ids)}
+
+    def __contains__(self, supplier_id) -> bool:
+        return supplier_id in self.supplier_index
+
+    def history(self, supplier_id) -> pd.DataFrame:
+        """All records of one supplier, oldest month first; empty for an unknown supplier"""
+        position = self.supplier_index.get(supplier_id)
+        if position is None:
+            return self.records.iloc[:0]
+        return self.records.iloc[self.offsets[position]:self.offsets[position + 1]]
@@ -0,0 +1,214 @@
+import operator
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Declarative invariants for monthly performance records. Missing values only
+# fail the not-null rules; every other rule lets them through.
+MONTHLY_SCHEMA: Dict[str, Any] = {
+    'columns': {
+        'Supplier_ID': {'type': 'string', 'nullable': False},
+        'Month': {'type': 'string', 'nullable': False},
+        'Units_Ordered': {'type': 'numeric', 'min': 0},
+        'Units_Delivered': {'type': 'numeric', 'min': 0},
+        'On_Time_Delivery_Rate': {'type': 'numeric', 'min': 0, 'max': 100},
+        'Quality_Score': {'type': 'numeric', 'min': 60, 'max': 100},
+        'Unit_Cost_USD': {'type': 'numeric', 'min': 0},
+        'Lead_Time_Days': {'type': 'numeric', 'min': 0},
+        'Defect_Rate_PPM': {'type': 'numeric', 'min': 0},
+        'First_Pass_Yield': {'type': 'numeric', 'min': 0, 'max': 100},
+        'Invoice_Accuracy_Rate': {'type': 'numeric', 'min': 0, 'max': 100},
+        'Sustainability_Score': {'type': 'numeric', 'min': 1, 'max': 10},
+        'Innovation_Score': {'type': 'numeric', 'min': 1, 'max': 10},
+        'Financial_Stability_Score': {'type': 'numeric', 'min': 1, 'max': 10},
+        'Capacity_Utilization': {'type': 'numeric', 'min': 0, 'max': 100},
+        'Total_Cost_USD': {'type': 'numeric', 'min': 0},
+        'OTIF_Rate': {'type': 'numeric', 'min': 0, 'max': 100}
+    },
+    'comparisons': [
+        ('Units_Delivered', '<=', 'Units_Ordered')
+    ],
+    # Column -> (expression it must equal, absolute tolerance)
+    'derived': {
+        'OTIF_Rate': ('On_Time_Delivery_Rate * Quality_Score / 100', 0.01),
+        'Total_Cost_USD': ('Units_Delivered * Unit_Cost_USD', 0.01)
+    },
+    'unique': [
+        ('Supplier_ID', 'Month')
+    ]
+}
+
+_COMPARISONS = {
+    '<': operator.lt, '<=': operator.le, '>': operator.gt,
+    '>=': operator.ge, '==': operator.eq, '!=': operator.ne
+}
+
+
+class Rule:
+    """A named row-level check returning a boolean mask of the rows that pass"""
+
+    def __init__(self, name: str, kind: str, columns: List[str], check: Callable[[pd.DataFrame], np.ndarray]):
+        self.name = name
+        self.kind = kind
+        self.columns = columns
+        self.check = check
+
+    def __repr__(self) -> str:
+        return f"Rule({self.name!r})"
+
+
+def _not_null_rule(column: str) -> Rule:
+    return Rule(f'{column} not null', 'not_null', [column],
+                lambda frame: frame[column].notna().to_numpy())
+
+
+def _range_rule(column: str, low: Optional[float], high: Optional[float]) -> Rule:
+    def check(frame: pd.DataFrame) -> np.ndarray:
+        values = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        failed = np.zeros(len(values), dtype=bool)
+        if low is not None:
+            failed |= values < low
+        if high is not None:
+            failed |= values > high
+        return ~failed
+
+    bounds = f"[{'-inf' if low is None else low}, {'inf' if high is None else high}]"
+    return Rule(f'{column} in {bounds}', 'range', [column], check)
+
+
+def _comparison_rule(left: str, op: str, right: str) -> Rule:
+    compare = _COMPARISONS[op]
+
+    def check(frame: pd.DataFrame) -> np.ndarray:
+        a = frame[left].to_numpy(dtype=np.float64, na_value=np.nan)
+        b = frame[right].to_numpy(dtype=np.float64, na_value=np.nan)
+        return compare(a, b) | np.isnan(a) | np.isnan(b)
+
+    return Rule(f'{left} {op} {right}', 'comparison', [left, right], check)
+
+
+def _derived_rule(column: str, expression: str, tolerance: float) -> Rule:
+    def check(frame: pd.DataFrame) -> np.ndarray:
+        actual = frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        expected = np.asarray(frame.eval(expression), dtype=np.float64)
+        return (np.abs(actual - expected) <= tolerance) | np.isnan(actual) | np.isnan(expected)
+
+    return Rule(f'{column} = {expression}', 'derived', [column], check)
+
+
+def _unique_rule(columns: List[str]) -> Rule:
+    # The first occurrence is kept; later duplicates are the violations
+    return Rule(f"unique ({', '.join(columns)})", 'unique', list(columns),
+                lambda frame: ~frame.duplicated(subset=list(columns), keep='first').to_numpy())
+
+
+def compile_rules(schema: Dict[str, Any]) -> List[Rule]:
+    """Expand a declarative schema into rules, cheapest kinds first"""
+    rules = []
+    for column, spec in schema.get('columns', {}).items():
+        if not spec.get('nullable', True):
+            rules.append(_not_null_rule(column))
+    for column, spec in schema.get('columns', {}).items():
+        if 'min' in spec or 'max' in spec:
+            rules.append(_range_rule(column, spec.get('min'), spec.get('max')))
+    for left, op, right in schema.get('comparisons', []):
+        rules.append(_comparison_rule(left, op, right))
+    for column, (expression, tolerance) in schema.get('derived', {}).items():
+        rules.append(_derived_rule(column, expression, tolerance))
+    for columns in schema.get('unique', []):
+        rules.append(_unique_rule(list(columns)))
+    return rules
+
+
+def check_columns(frame: pd.DataFrame, schema: Dict[str, Any]):
+    """Raise ValueError if required columns are missing or have the wrong type"""
+    problems = []
+    for column, spec in schema.get('columns', {}).items():
+        if column not in frame.columns:
+            problems.append(f"missing column '{column}'")
+        elif spec.get('type') == 'numeric' and not pd.api.types.is_numeric_dtype(frame[column]):
+            problems.append(f"column '{column}' is {frame[column].dtype}, expected numeric")
+    if problems:
+        raise ValueError('Invalid performance records: ' + '; '.join(problems))
+
+
+class ValidationResult:
+    """Outcome of validate(): clean rows, quarantined rows and a per-rule report"""
+
+    def __init__(self, valid: pd.DataFrame, quarantine: pd.DataFrame, report: pd.DataFrame, seconds: float):
+        self.valid = valid
+        self.quarantine = quarantine
+        self.report = report
+        self.seconds = seconds
+
+    @property
+    def complete(self) -> bool:
+        """Whether every rule ran inside the time budget"""
+        return not (self.report['Status'] == 'skipped').any()
+
+    @property
+    def passed(self) -> bool:
+        """Whether every rule ran and no row was quarantined"""
+        return self.complete and self.quarantine.empty
+
+    def __repr__(self) -> str:
+        return (f"ValidationResult(valid={len(self.valid):,}, quarantined={len(self.quarantine):,}, "
+                f"complete={self.complete}, seconds={self.seconds:.3f})")
+
+
+def validate(
+    frame: pd.DataFrame,
+    schema: Optional[Dict[str, Any]] = None,
+    time_budget: Optional[float] = None,
+    max_examples: int = 5
+) -> ValidationResult:
+    """Check every rule of a schema with columnar masks and quarantine failing rows.
+
+    Each rule's failures are recorded as one bit of a per-row violation mask,
+    so the quarantine lists every rule a row broke without iterating rows.
+    When ``time_budget`` (seconds) runs out, the remaining rules are reported
+    as skipped and their rows are not checked.
+    """
+    schema = MONTHLY_SCHEMA if schema is None else schema
+    start = time.perf_counter()
+    check_columns(frame, schema)
+    rules = compile_rules(schema)
+    if len(rules) > 64:
+        raise ValueError(f"At most 64 rules fit the violation mask, got {len(rules)}")
+
+    violations = np.zeros(len(frame), dtype=np.uint64)
+    report = []
+    for bit, rule in enumerate(rules):
+        if time_budget is not None and time.perf_counter() - start > time_budget:
+            report.append({'Rule': rule.name, 'Kind': rule.kind, 'Status': 'skipped', 'Violations': 0,
+                           'Share': 0.0, 'Examples': [], 'Seconds': 0.0})
+            continue
+        rule_start = time.perf_counter()
+        failed = ~rule.check(frame)
+        count = int(failed.sum())
+        if count:
+            violations[failed] |= np.uint64(1 << bit)
+        report.append({
+            'Rule': rule.name,
+            'Kind': rule.kind,
+            'Status': 'failed' if count else 'passed',
+            'Violations': count,
+            'Share': count / len(frame) if len(frame) else 0.0,
+            'Examples': frame.index[np.flatnonzero(failed)[:max_examples]].tolist(),
+            'Seconds': time.perf_counter() - rule_start
+        })
+
+    bad = violations != 0
+    quarantine = frame[bad].copy()
+    if bad.any():
+        # Decode each distinct bit pattern once rather than once per row
+        patterns, inverse = np.unique(violations[bad], return_inverse=True)
+        labels = np.array(['; '.join(rule.name for bit, rule in enumerate(rules) if int(pattern) >> bit & 1)
+                           for pattern in patterns], dtype=object)
+        quarantine['Failed_Rules'] = labels[inverse]
+    else:
+        quarantine['Failed_Rules'] = pd.Series(dtype=object)
+
+    return ValidationResult(frame[~bad], quarantine, pd.DataFrame(report), time.perf_counter() - start)